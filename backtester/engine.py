@@ -74,6 +74,9 @@ class PlaybackEngine:
         # Playback thread
         self._playback_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
+        # Set whenever playback is not running, see wait_until_done()
+        self._done = threading.Event()
+        self._done.set()
         
         logger.info(
             f"PlaybackEngine initialized: {symbols} from {start_date.date()} "
@@ -194,6 +197,24 @@ class PlaybackEngine:
                         callback(new_state)
                     except Exception as e:
                         logger.error(f"Error in state callback: {e}")
+                
+                # After the callbacks, so waiters see their effects
+                if new_state == PlaybackState.PLAYING:
+                    self._done.clear()
+                else:
+                    self._done.set()
+    
+    def wait_until_done(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until playback leaves the playing state
+        
+        Args:
+            timeout: Maximum seconds to wait (None = no limit)
+            
+        Returns:
+            True if playback is no longer playing, False on timeout
+        """
+        return self._done.wait(timeout)
     
     def get_state(self) -> PlaybackState:
         """Get current playback state"""
@@ -2,4 +2,12 @@
 Data layer package for the LumosTrade platform
 """
 
-from data_layer.market_stream.stream import MarketStream
+
+def __getattr__(name):
+    # MarketStream is imported on first access: importing it pulls in the
+    # whole market_stream package (Redis, websockets, config), which e.g.
+    # data_layer.worker_manager has no use for
+    if name == "MarketStream":
+        from data_layer.market_stream.stream import MarketStream
+        return MarketStream
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,7 @@
 import logging
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Callable
 from datetime import datetime
 
@@ -15,6 +16,7 @@ class WorkerInfo:
         self.start_method = start_method
         self.stop_method = stop_method
         self.started = False
+        self.stopping = False  # Claimed by a stop_worker call in progress
         self.start_time = None
         self.stop_time = None
         self.error_count = 0
@@ -84,6 +86,10 @@ class WorkerManager:
             
             return True
     
+    def is_registered(self, name: str) -> bool:
+        with self._lock:
+            return name in self._workers
+    
     def start_worker(self, name: str) -> bool:
         with self._lock:
             if name not in self._workers:
@@ -125,19 +131,31 @@ class WorkerManager:
                 logger.warning(f"Worker {name} not started")
                 return True
             
-            try:
-                stop_method = getattr(worker_info.worker_instance, worker_info.stop_method)
-                stop_method()
-                worker_info.started = False
-                worker_info.stop_time = datetime.now()
-                logger.info(f"Worker {name} stopped successfully")
-                
+            if worker_info.stopping:
+                logger.warning(f"Worker {name} is already being stopped")
                 return True
-                    
-            except Exception as e:
-                logger.error(f"Error stopping worker {name}: {e}")
+            worker_info.stopping = True
+        
+        # The worker's own stop (thread joins, disconnects) runs without the
+        # lock, so stop_all_workers can stop several workers at once; the
+        # stopping flag keeps concurrent callers from stopping it twice
+        try:
+            stop_method = getattr(worker_info.worker_instance, worker_info.stop_method)
+            stop_method()
+        except Exception as e:
+            logger.error(f"Error stopping worker {name}: {e}")
+            with self._lock:
+                worker_info.stopping = False
                 worker_info.error_count += 1
-                return False
+            return False
+        
+        with self._lock:
+            worker_info.started = False
+            worker_info.stopping = False
+            worker_info.stop_time = datetime.now()
+        logger.info(f"Worker {name} stopped successfully")
+        
+        return True
     
     def start_all_workers(self) -> Dict[str, bool]:
         results = {}
@@ -152,10 +170,13 @@ class WorkerManager:
         return results
     
     def stop_all_workers(self) -> Dict[str, bool]:
-        results = {}
-        
-        for name in list(self._workers.keys()):
-            results[name] = self.stop_worker(name)
+        names = list(self._workers.keys())
+        if not names:
+            results = {}
+        else:
+            # Stop in parallel: shutdown takes as long as the slowest worker
+            with ThreadPoolExecutor(max_workers=len(names)) as executor:
+                results = dict(zip(names, executor.map(self.stop_worker, names)))
 
         success_count = sum(1 for v in results.values() if v)
         logger.info(f"Stopped {success_count}/{len(results)} workers")
@@ -16,6 +16,16 @@ logger = logging.getLogger(__name__)
 class IndicatorCalculator:
     """Calculate technical indicators from candle data"""
     
+    # Windowed indicators: rows of history beyond `length` needed for the latest value
+    _WINDOW_EXTRA_ROWS = {
+        'sma': 0,
+        'vol_sma': 0,
+        'bbands': 0,
+        'rsi': 1,
+        'roc': 1,
+        'atr': 1,
+    }
+    
     def __init__(self, config: Optional[FeatureConfig] = None):
         """Initialize the calculator"""
         self.config = config or DEFAULT_FEATURE_CONFIG
@@ -77,6 +87,67 @@ class IndicatorCalculator:
             logger.error(f"Error calculating indicators: {e}", exc_info=True)
             return {}
     
+    def update(self, candles: list, previous: Dict[str, list]) -> Optional[Dict[str, list]]:
+        """
+        Extend indicators computed for candles[:-1] with values for candles[-1]
+        
+        Windowed indicators are recomputed over just the rows they look back
+        on, EMA advances its recursion from the previous value, and any other
+        indicator is recomputed in full. Returns None when a full
+        calculate_indicators() is needed instead (no usable previous result,
+        or higher-timeframe columns present).
+        
+        Args:
+            candles: List of CandleData objects
+            previous: Result of calculate_indicators(candles[:-1])
+            
+        Returns:
+            Dictionary of indicator names to value lists, or None
+        """
+        if len(candles) < 3 or not previous:
+            return None
+        if any(len(values) != len(candles) - 1 for values in previous.values()):
+            return None
+        if any(k.startswith(f"{tf}_") for tf in self.config.timeframes for k in previous):
+            return None
+        
+        try:
+            full_df = None
+            indicators = {}
+            for ind_config in self.config.indicators:
+                name = ind_config.name.lower()
+                indicator = self.registry.create_indicator(name, ind_config.params)
+                if not indicator:
+                    continue
+                columns = indicator.get_output_columns()
+                if any(col not in previous for col in columns):
+                    return None
+                
+                if name == 'ema':
+                    # pandas ewm(adjust=False): y_t = a * x_t + (1 - a) * y_{t-1}
+                    alpha = 2.0 / (indicator.length + 1)
+                    col = columns[0]
+                    prev = previous[col][-1]
+                    indicators[col] = previous[col] + [alpha * candles[-1].close + (1 - alpha) * prev]
+                elif name in self._WINDOW_EXTRA_ROWS:
+                    rows = indicator.length + self._WINDOW_EXTRA_ROWS[name]
+                    last_row = indicator.calculate(self._candles_to_dataframe(candles[-rows:])).iloc[-1]
+                    for col in columns:
+                        value = last_row[col]
+                        indicators[col] = previous[col] + [0 if pd.isna(value) else float(value)]
+                else:
+                    if full_df is None:
+                        full_df = self._candles_to_dataframe(candles)
+                    result_df = indicator.calculate(full_df)
+                    for col in columns:
+                        indicators[col] = result_df[col].fillna(0).tolist()
+                        
+            return indicators
+            
+        except Exception as e:
+            logger.warning(f"Incremental indicator update failed, falling back to full recompute: {e}")
+            return None
+    
     def _candles_to_dataframe(self, candles: list) -> pd.DataFrame:
         """Convert candle list to pandas DataFrame"""
         data = {
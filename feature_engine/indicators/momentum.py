@@ -145,9 +145,12 @@ class CCIIndicator(OHLCBasedIndicator):
         """Calculate CCI from OHLC"""
         typical_price = (high + low + close) / 3
         sma = typical_price.rolling(window=self.length).mean()
-        mad = typical_price.rolling(window=self.length).apply(
-            lambda x: np.mean(np.abs(x - x.mean())), raw=False
-        )
+        # Mean absolute deviation over each window, computed on a strided view
+        mad_values = np.full(len(typical_price), np.nan)
+        if len(typical_price) >= self.length:
+            windows = np.lib.stride_tricks.sliding_window_view(typical_price.to_numpy(dtype=float), self.length)
+            mad_values[self.length - 1:] = np.abs(windows - windows.mean(axis=1, keepdims=True)).mean(axis=1)
+        mad = pd.Series(mad_values, index=typical_price.index)
         return (typical_price - sma) / (0.015 * mad)
 
     def get_output_columns(self) -> list:
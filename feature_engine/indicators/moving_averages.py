@@ -2,10 +2,22 @@
 Simple Moving Average indicator
 """
 
+import numpy as np
 import pandas as pd
 from .base import PriceBasedIndicator
 
 
+def _wma(series: pd.Series, length: int) -> pd.Series:
+    """Linearly weighted moving average (weights 1..length, newest heaviest)"""
+    weights = np.arange(1, length + 1, dtype=float)
+    values = series.to_numpy(dtype=float)
+    result = np.full(len(values), np.nan)
+    if len(values) >= length:
+        # convolve flips the kernel, so reverse it to put the largest weight last
+        result[length - 1:] = np.convolve(values, weights[::-1], mode='valid') / weights.sum()
+    return pd.Series(result, index=series.index)
+
+
 class SMAIndicator(PriceBasedIndicator):
     """Simple Moving Average"""
 
@@ -59,10 +71,7 @@ class WMAIndicator(PriceBasedIndicator):
 
     def _calculate_from_close(self, close: pd.Series) -> pd.Series:
         """Calculate WMA from close prices"""
-        weights = pd.Series(range(1, self.length + 1))
-        return close.rolling(window=self.length).apply(
-            lambda x: (x * weights).sum() / weights.sum(), raw=False
-        )
+        return _wma(close, self.length)
 
     def get_output_columns(self) -> list:
         return [f"WMA_{self.length}"]
@@ -84,17 +93,11 @@ class HMAIndicator(PriceBasedIndicator):
         half_length = int(self.length / 2)
         sqrt_length = int(self.length ** 0.5)
 
-        wma_half = close.rolling(window=half_length).apply(
-            lambda x: (x * pd.Series(range(1, half_length + 1))).sum() / sum(range(1, half_length + 1)), raw=False
-        )
-        wma_full = close.rolling(window=self.length).apply(
-            lambda x: (x * pd.Series(range(1, self.length + 1))).sum() / sum(range(1, self.length + 1)), raw=False
-        )
+        wma_half = _wma(close, half_length)
+        wma_full = _wma(close, self.length)
 
         diff = 2 * wma_half - wma_full
-        return diff.rolling(window=sqrt_length).apply(
-            lambda x: (x * pd.Series(range(1, sqrt_length + 1))).sum() / sum(range(1, sqrt_length + 1)), raw=False
-        )
+        return _wma(diff, sqrt_length)
 
     def get_output_columns(self) -> list:
         return [f"HMA_{self.length}"]
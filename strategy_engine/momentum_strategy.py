@@ -1,8 +1,12 @@
 import logging
-from typing import Dict, Optional, Deque
+from dataclasses import asdict, fields
+from typing import Dict, Optional, Deque, List
 from collections import deque, defaultdict
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
+
 from strategy_engine.base_strategy import BaseStrategy
 from common.models import SignalEvent, CandleData
 
@@ -29,6 +33,9 @@ class MomentumStrategy(BaseStrategy):
     4. Momentum Decay Exit: Range Contraction + ROC Decay + Stagnation (5 bars)
     5. End of Day: Square off all positions (intraday only, at 16:00)
     """
+
+    # Length of the per-feature history buffers
+    HISTORY_MAXLEN = 30
     
     def __init__(self, config: Dict = None):
         super().__init__(config or {})
@@ -44,7 +51,7 @@ class MomentumStrategy(BaseStrategy):
         
         # History buffers for comparison with previous values
         # Increased maxlen to support SMA calculation
-        self.history: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=30))
+        self.history: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=self.HISTORY_MAXLEN))
         
         # Trading State
         self.bars_in_trade = 0
@@ -58,6 +65,9 @@ class MomentumStrategy(BaseStrategy):
         self.highest_price = 0.0
         self.lowest_price = 0.0  # MAE tracking
         self.atr_at_entry = 0.0
+        self.execution_risk = 0.0
+        self.safe_risk = 1.0
+        self._inv_safe_risk = 1.0  # 1 / safe_risk, fixed for the life of a position
         self.trailing_active = False
 
         self.last_ignition_time = None # Time tracking
@@ -67,6 +77,7 @@ class MomentumStrategy(BaseStrategy):
         self.candles_since_high = 0  # Track candles without new high
         self.high_since_entry = 0.0  # Track highest close since entry
         self.entry_hour = 0  # Track entry hour for end-of-day exit
+        self._eod_cutoff: Optional[datetime] = None  # 16:00 on the current trading day
         
         # Cooldown and Asset Type
         self.cooldown_bars = self.config.get('cooldown_bars', 5)
@@ -107,6 +118,220 @@ class MomentumStrategy(BaseStrategy):
         # Check Entries
         return self._check_entry(candle, features)
 
+    def on_candles(self, df_candles: pd.DataFrame, df_features: pd.DataFrame,
+                   symbol: Optional[str] = None) -> pd.DataFrame:
+        """
+        Batch equivalent of feeding every row through on_candle (backtesting).
+
+        Entry filters are evaluated as NumPy masks over the whole series; only
+        position management (stop loss, breakeven, trailing, EOD) runs as a
+        sequential sweep over bars that are in a trade. Runs on local state, so
+        the incremental on_candle state of this instance is left untouched.
+
+        Args:
+            df_candles: OHLCV frame indexed by timestamp (or with a 'timestamp' column)
+            df_features: Indicator frame aligned row-for-row with df_candles
+            symbol: Symbol stamped on the signals (defaults to df_candles['symbol'])
+
+        Returns:
+            DataFrame with one row per SignalEvent (columns are its fields)
+        """
+        columns = [f.name for f in fields(SignalEvent)]
+        n = len(df_candles)
+        roc_key = f'ROC_{self.roc_period}'
+        if n < 2 or roc_key not in df_features.columns:
+            return pd.DataFrame(columns=columns)
+
+        if isinstance(df_candles.index, pd.DatetimeIndex):
+            timestamps = df_candles.index
+        else:
+            timestamps = pd.DatetimeIndex(df_candles['timestamp'])
+        hours = timestamps.hour.to_numpy()
+        if symbol is None and 'symbol' in df_candles.columns:
+            symbols = df_candles['symbol'].tolist()
+        else:
+            symbols = [symbol or ''] * n
+
+        def feature(name: str, default: Optional[float] = None) -> Optional[np.ndarray]:
+            if name in df_features.columns:
+                return df_features[name].to_numpy(dtype=float)
+            return None if default is None else np.full(n, default)
+
+        high = df_candles['high'].to_numpy(dtype=float)
+        low = df_candles['low'].to_numpy(dtype=float)
+        close = df_candles['close'].to_numpy(dtype=float)
+        atr = feature(f'ATRr_{self.atr_period}', 0.0)
+        donchian_high = feature(f'DonchianHigh_{self.donchian_period}')
+        donchian_low = feature(f'DonchianLow_{self.donchian_period}', 0.0)
+        htf_close = feature('15m_SMA_1', 0.0)
+        htf_ema = feature(f'15m_EMA_{self.htf_ema_period}', float('inf'))
+        sma_1 = feature('SMA_1')
+        f_close = feature('Close')
+        f_high = feature('High')
+        f_low = feature('Low')
+
+        # --- Vectorized entry filters (same order and thresholds as _check_entry) ---
+        candle_range = np.abs(high - low)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            entry = (atr != 0) & (htf_close > htf_ema)
+            if donchian_high is None or sma_1 is None:
+                entry[:] = False
+            else:
+                prev_donchian_high = np.full(n, np.inf)
+                prev_donchian_high[1:] = donchian_high[:-1]
+                entry &= close > prev_donchian_high
+                entry &= (donchian_high - donchian_low) < (1.50 * atr)
+                entry &= candle_range > (0.6 * atr)
+
+                # Velocity over k=3 bars (needs k+1 closes of history)
+                k = 3
+                entry[:k] = False
+                price_prev = np.full(n, np.nan)
+                price_prev[k:] = sma_1[:-k]
+                entry &= (close - price_prev) / atr > 0.8
+
+                # Persistence: at least 2 of the last 3 closes rising
+                rising = np.zeros(n, dtype=np.int8)
+                rising[1:] = sma_1[1:] > sma_1[:-1]
+                bullish_count = rising.copy()
+                bullish_count[1:] += rising[:-1]
+                bullish_count[2:] += rising[:-2]
+                entry &= bullish_count >= 2
+
+                # Minimum risk distance (0.4% of price)
+                stop_loss_level = close - (1.2 * atr)
+                entry &= (close - stop_loss_level) >= close * 0.004
+
+        # Range expansion needs a median, so it is only evaluated on survivors
+        candidates = np.flatnonzero(entry)
+        if len(candidates):
+            ranges = np.abs(f_high - f_low) if f_high is not None and f_low is not None else None
+            keep = []
+            for i in candidates.tolist():
+                if ranges is None:
+                    median_range = max(atr[i], 0.0001)
+                else:
+                    window = np.sort(ranges[max(0, i - 9):i + 1])
+                    median_range = window[len(window) // 2]
+                range_ratio = candle_range[i] / median_range if median_range > 0 else 0
+                keep.append(range_ratio > 1.2)
+            candidates = candidates[np.array(keep, dtype=bool)]
+
+        # --- Sequential sweep: position state, stops and EOD ---
+        signals: List[SignalEvent] = []
+        ts_list = timestamps.to_pydatetime()
+        high_l, low_l, close_l, atr_l = high.tolist(), low.tolist(), close.tolist(), atr.tolist()
+        hours_l = hours.tolist()
+        last_ignition_time = None
+        # on_candle starts flat with the cooldown satisfied and skips bar 0 (no ROC history)
+        next_allowed = 1
+
+        while True:
+            pos = int(np.searchsorted(candidates, next_allowed))
+            if pos >= len(candidates):
+                break
+            i = int(candidates[pos])
+
+            # Entry
+            entry_price = close_l[i]
+            entry_atr = atr_l[i]
+            stop_loss = entry_price - (1.2 * entry_atr)
+            execution_risk = entry_price - stop_loss
+            safe_risk = execution_risk if execution_risk > 0 else max(entry_atr, 1.0)
+            inv_safe_risk = 1.0 / safe_risk
+            timestamp = ts_list[i]
+            time_since_last = None
+            if last_ignition_time:
+                time_since_last = (timestamp - last_ignition_time).total_seconds()
+            last_ignition_time = timestamp
+            signals.append(SignalEvent(
+                timestamp=timestamp,
+                symbol=symbols[i],
+                algorithm="MomentumStrategy",
+                signal_type="BUY",
+                confidence=1.0,
+                reason="IGNITION Entry",
+                indicators={
+                    'price': entry_price,
+                    'stop_loss': stop_loss,
+                    'atr': entry_atr,
+                    'ema_9': self._window_ema(sma_1, i, 9),
+                    'time_since_last_ignition_seconds': time_since_last,
+                    'risk_per_share': execution_risk
+                }
+            ))
+
+            highest_price = lowest_price = high_since_entry = entry_price
+            breakeven_hit = False
+            trailing_active = False
+            exit_index = None
+
+            for j in range(i + 1, n):
+                highest_price = max(highest_price, high_l[j])
+                lowest_price = min(lowest_price, low_l[j])
+                high_since_entry = max(high_since_entry, close_l[j])
+                r_multiple = (highest_price - entry_price) * inv_safe_risk
+
+                if not breakeven_hit and r_multiple >= 3.0:
+                    ema_9 = self._window_ema(f_close, j, 9)
+                    if close_l[j] > ema_9:
+                        stop_loss = entry_price
+                        breakeven_hit = True
+
+                if r_multiple >= 4.0:
+                    trailing_active = True
+                if trailing_active:
+                    stop_loss = max(stop_loss, high_since_entry - (0.8 * atr_l[j]))
+
+                if low_l[j] <= stop_loss:
+                    exit_price = stop_loss
+                    reason = f"Stop Loss Hit at {r_multiple:.2f}R"
+                elif hours_l[j] >= 16:
+                    exit_price = close_l[j]
+                    reason = "End of Day Exit"
+                else:
+                    continue
+
+                signals.append(SignalEvent(
+                    timestamp=ts_list[j],
+                    symbol=symbols[j],
+                    algorithm="MomentumStrategy",
+                    signal_type="SELL",
+                    confidence=1.0,
+                    reason=reason,
+                    indicators={
+                        'price': exit_price,
+                        'mae_r': (entry_price - lowest_price) * inv_safe_risk,
+                        'mfe_r': r_multiple,
+                        'highest_price': highest_price,
+                        'lowest_price': lowest_price,
+                        'risk_per_share': safe_risk
+                    }
+                ))
+                exit_index = j
+                break
+
+            if exit_index is None:
+                break
+            next_allowed = exit_index + self.cooldown_bars
+
+        return pd.DataFrame([asdict(signal) for signal in signals], columns=columns)
+
+    def _window_ema(self, values: Optional[np.ndarray], end: int, period: int) -> float:
+        """EMA over the history window ending at `end`, matching _calculate_ema"""
+        if values is None:
+            return 0.0
+        start = max(0, end + 1 - self.HISTORY_MAXLEN)
+        if end + 1 - start < period:
+            return 0.0
+
+        multiplier = 2 / (period + 1)
+        data = values[start:end + 1].tolist()
+        ema = data[0]
+        for price in data[1:]:
+            ema = (price - ema) * multiplier + ema
+        return ema
+
     def _calculate_ema(self, series_name: str, period: int) -> float:
         """Calculate EMA from history"""
         if len(self.history[series_name]) < period:
@@ -165,33 +390,56 @@ class MomentumStrategy(BaseStrategy):
         atr = features.get(atr_key, 0)
         if atr == 0: return None
 
+        # Filters are evaluated cheapest-first so that the vast majority of bars
+        # are rejected before the momentum block (median range, persistence) runs.
+
+        # 1. HTF Alignment: 15m Close > 15m EMA20
+        htf_close = features.get('15m_SMA_1', 0) 
+        htf_ema_key = f'15m_EMA_{self.htf_ema_period}'
+        htf_ema = features.get(htf_ema_key, float('inf'))
+        if not htf_close > htf_ema:
+            return None
+
+        # 2. Confirmed Breakout: Close > PrevDonchHigh
         donchian_high_key = f'DonchianHigh_{self.donchian_period}'
         donchian_low_key = f'DonchianLow_{self.donchian_period}'
+        donchian_history = self.history[donchian_high_key]
+        prev_donchian_high = donchian_history[-2] if len(donchian_history) >= 2 else float('inf')
+        if not candle.close > prev_donchian_high:
+            return None
+
+        # 3. Range Compression: (DonchHigh - DonchLow) < 1.5 * ATR
         donchian_high = features.get(donchian_high_key, 0)
         donchian_low = features.get(donchian_low_key, 0)
-        
-        roc_key = f'ROC_{self.roc_period}'
-        roc = features.get(roc_key, 0)
-        
-        # 1. Range Compression: (DonchHigh - DonchLow) < 1.5 * ATR
-        is_compressed = (donchian_high - donchian_low) < (1.50 * atr)
-        
-        # 2. Confirmed Breakout: Close > PrevDonchHigh
-        prev_donchian_high = self.history[donchian_high_key][-2] if len(self.history[donchian_high_key]) >= 2 else float('inf')
-        is_breakout = candle.close > prev_donchian_high
-        
-        # 3. Momentum Checks
+        if not (donchian_high - donchian_low) < (1.50 * atr):
+            return None
+
+        # 4. Participation
+        candle_range = abs(candle.high - candle.low)
+        if not candle_range > (0.6 * atr):
+            return None
+
+        # 5. Momentum Checks (only reached by bars that passed every cheap filter)
         # Velocity
         k = 3
-        if len(self.history['SMA_1']) < k + 1:
+        closes = self.history['SMA_1']
+        if len(closes) < k + 1:
             return None
 
         price_now = candle.close
-        price_prev = self.history['SMA_1'][-(k+1)]
+        price_prev = closes[-(k+1)]
         velocity = (price_now - price_prev) / atr
-        is_velocity = velocity > 0.8
-        
-        candle_range = abs(candle.high - candle.low)
+        if not velocity > 0.8:
+            return None
+
+        # Persistence
+        bullish_count = sum(
+            1 for i in range(3)
+            # Check length is guaranteed by k+1 check above
+            if closes[-(i+1)] > closes[-(i+2)]
+        )
+        if bullish_count < 2:
+            return None
 
         # Range expansion
         recent_ranges = [
@@ -206,50 +454,22 @@ class MomentumStrategy(BaseStrategy):
             median_range = sorted(recent_ranges)[len(recent_ranges)//2]
             
         range_ratio = candle_range / median_range if median_range > 0 else 0
-        is_expansion = range_ratio > 1.2
-
-        # Persistence
-        bullish_count = sum(
-            1 for i in range(3)
-            # Check length is guaranteed by k+1 check above
-            if self.history['SMA_1'][-(i+1)] > self.history['SMA_1'][-(i+2)]
-        )
-        is_persistent = bullish_count >= 2
+        if not range_ratio > 1.2:
+            return None
 
-        is_momentum = is_velocity and is_expansion and is_persistent
-        
-        # 4. Participation
-        is_participation = candle_range > (0.6 * atr)
-            
-        # 5. HTF Alignment: 15m Close > 15m EMA20
-        htf_close = features.get('15m_SMA_1', 0) 
-        htf_ema_key = f'15m_EMA_{self.htf_ema_period}'
-        htf_ema = features.get(htf_ema_key, float('inf'))
-        is_htf_trend = htf_close > htf_ema
-        
-        # 6. EMA 9 Pullback Check (New)
+        # 6. EMA 9 (reported with the signal)
         ema_9 = self._calculate_ema('SMA_1', 9)
-        pullback_to_ema_9 = (candle.low <= ema_9) and (candle.close > ema_9)
 
         # --- Decision Logic ---
-        entry_type = None
-        confidence = 0.0
-        stop_loss_level = 0.0
-
-        if not is_htf_trend:
-            return None
-
-        if is_compressed and is_breakout and is_momentum and is_participation:
-             entry_type = "IGNITION"
-             confidence = 1.0
-             stop_loss_level = candle.close - (1.2 * atr)
-        # elif (not is_compressed) and pullback_to_ema_9:
+        # Compressed breakout with momentum and participation
+        entry_type = "IGNITION"
+        confidence = 1.0
+        stop_loss_level = candle.close - (1.2 * atr)
+        # CONTINUATION entries (not compressed, pullback to EMA 9) are disabled:
+        # pullback_to_ema_9 = (candle.low <= ema_9) and (candle.close > ema_9)
         #      entry_type = "CONTINUATION"
         #      confidence = 0.5
         #      stop_loss_level = candle.close - (0.8 * atr)
-             
-        if not entry_type:
-            return None
             
         # 2. Enforce minimum risk distance (0.4% of Price)
         calculated_risk = candle.close - stop_loss_level
@@ -264,6 +484,9 @@ class MomentumStrategy(BaseStrategy):
         # ATR at entry required for trailing stops
         self.atr_at_entry = atr
         self.execution_risk = calculated_risk  # Store real risk
+        # R denominator is fixed at entry; cache its reciprocal for the exit path
+        self.safe_risk = self.execution_risk if self.execution_risk > 0 else max(self.atr_at_entry, 1.0)
+        self._inv_safe_risk = 1.0 / self.safe_risk
         
         self.highest_price = candle.close
         self.lowest_price = candle.close # Init Low
@@ -271,6 +494,7 @@ class MomentumStrategy(BaseStrategy):
         self.candles_since_high = 0
         self.breakeven_hit = False
         self.entry_hour = candle.timestamp.hour
+        self._eod_cutoff = self._eod_cutoff_for(candle.timestamp)
         
         self.stop_loss = stop_loss_level
 
@@ -281,7 +505,7 @@ class MomentumStrategy(BaseStrategy):
                  time_since_last = (candle.timestamp - self.last_ignition_time).total_seconds()
              self.last_ignition_time = candle.timestamp
         
-        logger.info(f"{entry_type} ENTRY: {candle.symbol} @ {candle.close}, SL: {self.stop_loss:.4f} (Risk: {self.execution_risk:.4f})")
+        logger.info("%s ENTRY: %s @ %s, SL: %.4f (Risk: %.4f)", entry_type, candle.symbol, candle.close, self.stop_loss, self.execution_risk)
         self.bars_in_trade = 0
         
         return SignalEvent(
@@ -301,6 +525,11 @@ class MomentumStrategy(BaseStrategy):
             }
         )
 
+    @staticmethod
+    def _eod_cutoff_for(timestamp: datetime) -> datetime:
+        """End-of-day square-off time (16:00) for the day of `timestamp`"""
+        return timestamp.replace(hour=16, minute=0, second=0, microsecond=0)
+
     def _check_exit(self, candle: CandleData, features: Dict[str, float]) -> Optional[SignalEvent]:
         """
         Exact Exit Logic:
@@ -319,14 +548,15 @@ class MomentumStrategy(BaseStrategy):
         self.high_since_entry = max(self.high_since_entry, candle.close)
         
         # Calculate R multiple based on REAL RISK (Entry - Initial SL)
-        safe_risk = self.execution_risk if hasattr(self, 'execution_risk') and self.execution_risk > 0 else max(self.atr_at_entry, 1.0)
-        r_multiple = (self.highest_price - self.entry_price) / safe_risk
+        safe_risk = self.safe_risk
+        inv_safe_risk = self._inv_safe_risk
         
         # Calculate Exit Metrics for Analytics
         mae_price = self.entry_price - self.lowest_price
         mfe_price = self.highest_price - self.entry_price
-        mae_r = mae_price / safe_risk
-        mfe_r = mfe_price / safe_risk
+        r_multiple = mfe_price * inv_safe_risk
+        mae_r = mae_price * inv_safe_risk
+        mfe_r = r_multiple
         
         # EMA 9 for BE Check
         ema_9 = self._calculate_ema('Close', 9)
@@ -337,12 +567,12 @@ class MomentumStrategy(BaseStrategy):
             if r_multiple >= 3.0 and candle.close > ema_9:
                 self.stop_loss = self.entry_price
                 self.breakeven_hit = True
-                logger.info(f"Delayed Breakeven activated at +{r_multiple:.2f}R, SL moved to Entry")
+                logger.info("Delayed Breakeven activated at +%.2fR, SL moved to Entry", r_multiple)
         
         # ===== TRAILING STOP (Adjusted) =====
         if r_multiple >= 4.0 and not self.trailing_active:
             self.trailing_active = True
-            logger.info(f"Trailing stop activated at +{r_multiple:.2f}R")
+            logger.info("Trailing stop activated at +%.2fR", r_multiple)
         
         if self.trailing_active:
             # SL = Highest Close − 0.8×ATR
@@ -356,7 +586,7 @@ class MomentumStrategy(BaseStrategy):
             self.breakeven_hit = False
             self.bars_in_trade = 0
             self.bars_since_exit = 0  # Reset cooldown
-            logger.info(f"EXIT SIGNAL: {candle.symbol} @ {self.stop_loss:.4f} (Stop Loss at {r_multiple:.2f}R)")
+            logger.info("EXIT SIGNAL: %s @ %.4f (Stop Loss at %.2fR)", candle.symbol, self.stop_loss, r_multiple)
             
             return SignalEvent(
                 timestamp=candle.timestamp,
@@ -414,7 +644,7 @@ class MomentumStrategy(BaseStrategy):
         #     self.breakeven_hit = False
         #     self.bars_in_trade = 0
         #     self.bars_since_exit = 0  # Reset cooldown
-        #     logger.info(f"EXIT SIGNAL: {candle.symbol} @ {candle.close:.4f} (Momentum Decay)")
+        #     logger.info("EXIT SIGNAL: %s @ %.4f (Momentum Decay)", candle.symbol, candle.close)
             
             # return SignalEvent(
             #     timestamp=candle.timestamp,
@@ -426,14 +656,14 @@ class MomentumStrategy(BaseStrategy):
             # )
         
         # ===== EXACT EXIT RULE 5: End of Day (intraday only) =====
-        # Check if we've crossed into next hour/day relative to entry
-        current_hour = candle.timestamp.hour
-        # Simple EOD check: if current hour is in next business day or after 16:00 (4 PM)
+        # Exit at or after 16:00 (4 PM). The cutoff is cached at entry, so the
+        # common case is a single datetime compare; it is only re-derived when
+        # the position is held across midnight.
         is_eod = False
-        if hasattr(candle.timestamp, 'hour'):
-            # For intraday: exit at 4 PM (16:00) or if day changed
-            if current_hour >= 16:  # 4 PM
-                is_eod = True
+        if candle.timestamp >= self._eod_cutoff:
+            if candle.timestamp.date() != self._eod_cutoff.date():
+                self._eod_cutoff = self._eod_cutoff_for(candle.timestamp)
+            is_eod = candle.timestamp >= self._eod_cutoff
         
         if is_eod:
             self.in_position = False
@@ -441,7 +671,7 @@ class MomentumStrategy(BaseStrategy):
             self.breakeven_hit = False
             self.bars_in_trade = 0
             self.bars_since_exit = 0  # Reset cooldown
-            logger.info(f"EXIT SIGNAL: {candle.symbol} @ {candle.close:.4f} (End of Day)")
+            logger.info("EXIT SIGNAL: %s @ %.4f (End of Day)", candle.symbol, candle.close)
             
             return SignalEvent(
                 timestamp=candle.timestamp,
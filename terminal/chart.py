@@ -3,12 +3,35 @@ Terminal-based Candlestick Chart Visualizer for LumosTrade
 Uses ASCII art for charting directly in the terminal
 """
 
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, ClassVar, FrozenSet, BinaryIO, Union
 from datetime import datetime
+import functools
+import io
 import logging
+import sys
+import time
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Market data cache is optional (needs the aggregator worker and its deps)
+try:
+    from src.data_layer.aggregator.fetch_data import get_market_data_from_cache
+    from src.data_layer.aggregator.worker import InMemoryCache
+except ImportError:
+    get_market_data_from_cache = None
+    InMemoryCache = None
+
+# Interval (seconds) -> display label, shared by the chart helpers
+_INTERVAL_MAP = {
+    60: '1m',
+    120: '2m',
+    300: '5m',
+    900: '15m',
+    3600: '1h'
+}
+
 
 class Colors:
     """ANSI color codes for terminal styling"""
@@ -23,23 +46,111 @@ class Colors:
     RESET = '\033[0m'
 
 
+# Pre-joined styles and static box borders (built once, reused every render)
+_AQUA_BOLD = Colors.AQUA + Colors.BOLD
+_BOX_EDGE = f"{Colors.WHITE}│{Colors.RESET}"
+_BOX_END = f"{Colors.RESET} {_BOX_EDGE}"
+_SUMMARY_TOP = f"{Colors.WHITE}┌─ Price Summary ─────────────────────────────────────┐{Colors.RESET}\n"
+_INDICATORS_TOP = f"\n{Colors.WHITE}┌─ Technical Indicators ───────────────────────────────┐{Colors.RESET}\n"
+_CANDLE_TOP = f"{Colors.WHITE}┌─ ASCII Candle ───────────────────────────────────────┐{Colors.RESET}\n"
+_BOX_BOTTOM = f"{Colors.WHITE}└──────────────────────────────────────────────────────┘{Colors.RESET}\n"
+_CANDLE_ROW_END = f"  {_BOX_EDGE}\n"
+_LEGEND = f"   {Colors.GREEN}█{Colors.RESET} Bullish  {Colors.RED}█{Colors.RESET} Bearish"
+
+# ASCII candle row segments (with the closing box edge) by bullishness and kind
+_SEG_BLANK, _SEG_WICK, _SEG_BODY = range(3)
+_CANDLE_UNLABELLED = f"{_BOX_EDGE}          "
+_CANDLE_SEG = {
+    is_bullish: (
+        f"      {_CANDLE_ROW_END}",
+        f"{color}    │{Colors.RESET}{_CANDLE_ROW_END}",
+        f"{body}{_CANDLE_ROW_END}",
+    )
+    for is_bullish, color, body in (
+        (True, Colors.GREEN, f"{Colors.GREEN}  ┃━┃{Colors.RESET}"),
+        (False, Colors.RED, f"{Colors.RED}  ┃█┃{Colors.RESET}"),
+    )
+}
+
+# Row prefixes of the price summary box
+_OPEN_ROW, _HIGH_ROW, _LOW_ROW, _CLOSE_ROW, _CHANGE_ROW, _VOLUME_ROW = (
+    f"{_BOX_EDGE} {label}"
+    for label in ("Open:   ", "High:   ", "Low:    ", "Close:  ", "Change: ", "Volume: ")
+)
+
+# Technical indicator rows for multi-timeframe price changes: (metrics key, row prefix)
+_PRICE_CHANGE_ROWS = tuple(
+    (f"price_change_{tf}", f"{_BOX_EDGE} {f'Change {tf}:':<12} ")
+    for tf in ("1m", "5m", "15m", "1h")
+)
+_PRICE_CHANGE_FMT = "{}{}{:>9.2f}%" + _BOX_END + "\n"
+
+# Multi-symbol view: symbol -> (last close, its formatted column); the close
+# often repeats between frames, so the ',.2f' formatting is skipped then
+_CLOSE_FMT_CACHE: Dict[str, Tuple[float, str]] = {}
+
+# create_chart output cache: key -> (monotonic render time, chart string)
+_RENDER_CACHE: Dict[Tuple, Tuple[float, str]] = {}
+_RENDER_CACHE_TTL = 0.2  # seconds
+_RENDER_CACHE_MAX = 64
+
+# Footer timestamp, re-formatted at most once per second
+_last_ts_sec = -1
+_last_ts_str = ""
+
+
+def _timestamp_str() -> str:
+    """Current local time as 'YYYY-MM-DD HH:MM:SS', cached per second"""
+    global _last_ts_sec, _last_ts_str
+    sec = int(time.time())
+    if sec != _last_ts_sec:
+        _last_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+        _last_ts_sec = sec
+    return _last_ts_str
+
+
+@functools.lru_cache(maxsize=16)
+def _chart_skeleton(interval_str: str, width: int) -> Tuple[str, str, str]:
+    """
+    Static pieces of a single-symbol chart for one (interval, width)
+
+    Returns:
+        (header before the symbol, header after the symbol, footer around the timestamp)
+    """
+    rule = CandlestickChart._rule(width)
+    return (
+        f"\n{rule}\n{_AQUA_BOLD}📊 ",
+        f" - {interval_str.upper()} Chart{Colors.RESET}\n{rule}\n\n",
+        f"{Colors.RESET}\n{rule}\n",
+    )
+
+
 class CandlestickChart:
     """Terminal-based candlestick chart renderer"""
+
+    # Map intervals to seconds for cache lookup
+    interval_to_seconds: ClassVar[Dict[str, int]] = {
+        "1m": 60,
+        "2m": 120,
+        "5m": 300,
+        "15m": 900,
+        "1h": 3600
+    }
+    # Reverse map for display
+    seconds_to_interval: ClassVar[Dict[int, str]] = {v: k for k, v in interval_to_seconds.items()}
+    supported_intervals: ClassVar[FrozenSet[str]] = frozenset(interval_to_seconds)
+
+    # Width -> coloured '═' rule, populated lazily
+    _border_cache: ClassVar[Dict[int, str]] = {}
     
-    def __init__(self):
-        """Initialize the chart renderer"""
-        self.supported_intervals = ["1m", "2m", "5m", "15m", "1h"]
-        # Map intervals to seconds for cache lookup
-        self.interval_to_seconds = {
-            "1m": 60,
-            "2m": 120,
-            "5m": 300,
-            "15m": 900,
-            "1h": 3600
-        }
-        # Reverse map for display
-        self.seconds_to_interval = {v: k for k, v in self.interval_to_seconds.items()}
-        
+    @classmethod
+    def _rule(cls, width: int) -> str:
+        """Coloured horizontal rule of the given width"""
+        rule = cls._border_cache.get(width)
+        if rule is None:
+            rule = cls._border_cache[width] = f"{Colors.AQUA}{'═' * width}{Colors.RESET}"
+        return rule
+
     def render(self, symbol: str, market_data: Dict[str, Any], 
                interval: Any = "1m", width: int = 100, height: int = 20) -> str:
         """
@@ -64,19 +175,19 @@ class CandlestickChart:
                 
             # Validate interval
             if interval_str not in self.supported_intervals:
-                return f"{Colors.RED}❌ Unsupported interval '{interval_str}'. Use: {', '.join(self.supported_intervals)}{Colors.RESET}"
+                return f"{Colors.RED}❌ Unsupported interval '{interval_str}'. Use: {', '.join(self.interval_to_seconds)}{Colors.RESET}"
             
             # Extract symbol data
-            if "symbols" not in market_data or symbol not in market_data["symbols"]:
+            symbol_data = market_data.get("symbols", {}).get(symbol)
+            if symbol_data is None:
                 return f"{Colors.RED}❌ Symbol '{symbol}' not found in market data{Colors.RESET}"
             
-            symbol_data = market_data["symbols"][symbol]
-            
             # Get OHLC data for the requested interval (check both formats)
             ohlc_data = None
-            if "ohlc" in symbol_data:
+            ohlc = symbol_data.get("ohlc")
+            if ohlc is not None:
                 # Try both string and integer formats
-                ohlc_data = symbol_data["ohlc"].get(interval_str) or symbol_data["ohlc"].get(interval)
+                ohlc_data = ohlc.get(interval_str) or ohlc.get(interval)
             
             if not ohlc_data:
                 return f"{Colors.YELLOW}⚠️  No {interval_str} OHLC data available for {symbol}{Colors.RESET}"
@@ -97,6 +208,16 @@ class CandlestickChart:
             logger.error(f"Error rendering chart for {symbol}: {e}", exc_info=True)
             return f"{Colors.RED}❌ Failed to render chart: {str(e)}{Colors.RESET}"
     
+    def render_bytes(self, symbol: str, market_data: Dict[str, Any],
+                     interval: Any = "1m", width: int = 100, height: int = 20) -> bytes:
+        """
+        Render a candlestick chart as UTF-8 bytes, encoded once per frame
+
+        Callers writing to a terminal can pass the result straight to
+        sys.stdout.buffer.write(), skipping text-mode encoding. See render().
+        """
+        return self.render(symbol, market_data, interval, width, height).encode('utf-8')
+
     def _create_candlestick_chart(self, symbol: str, ohlc_data: Dict[str, Any],
                                   metrics: Dict[str, Any], interval: str,
                                   width: int, height: int) -> str:
@@ -117,23 +238,25 @@ class CandlestickChart:
         # Note: We're not using plotext's plotting features due to API complexity
         # Instead, we'll create a clean ASCII representation
         
-        # Extract OHLC values
-        open_price = float(ohlc_data.get('open', 0))
-        high_price = float(ohlc_data.get('high', 0))
-        low_price = float(ohlc_data.get('low', 0))
-        close_price = float(ohlc_data.get('close', 0))
-        volume = float(ohlc_data.get('volume', 0))
+        # Extract OHLC values (producers emit floats, see CandleData)
+        open_price = ohlc_data.get('open', 0.0)
+        high_price = ohlc_data.get('high', 0.0)
+        low_price = ohlc_data.get('low', 0.0)
+        close_price = ohlc_data.get('close', 0.0)
+        volume = ohlc_data.get('volume', 0.0)
         
         # Determine candle color
         is_bullish = close_price >= open_price
         
-        # Build comprehensive output
-        output_lines = []
+        # Build comprehensive output in a single buffer
+        out = io.StringIO()
+        write = out.write
         
         # Header
-        output_lines.append(f"\n{Colors.AQUA}{'═' * width}{Colors.RESET}")
-        output_lines.append(f"{Colors.AQUA}{Colors.BOLD}📊 {symbol} - {interval.upper()} Chart{Colors.RESET}")
-        output_lines.append(f"{Colors.AQUA}{'═' * width}{Colors.RESET}\n")
+        header_head, header_tail, footer_tail = _chart_skeleton(interval, width)
+        write(header_head)
+        write(symbol)
+        write(header_tail)
         
         # Price summary box
         price_change = close_price - open_price
@@ -141,80 +264,64 @@ class CandlestickChart:
         change_color = Colors.GREEN if price_change >= 0 else Colors.RED
         change_arrow = "▲" if price_change >= 0 else "▼"
         
-        output_lines.append(f"{Colors.WHITE}┌─ Price Summary ─────────────────────────────────────┐{Colors.RESET}")
-        output_lines.append(f"{Colors.WHITE}│{Colors.RESET} Open:   {Colors.AQUA}{open_price:>12,.2f}{Colors.RESET} {Colors.WHITE}│{Colors.RESET}")
-        output_lines.append(f"{Colors.WHITE}│{Colors.RESET} High:   {Colors.GREEN}{high_price:>12,.2f}{Colors.RESET} {Colors.WHITE}│{Colors.RESET}")
-        output_lines.append(f"{Colors.WHITE}│{Colors.RESET} Low:    {Colors.RED}{low_price:>12,.2f}{Colors.RESET} {Colors.WHITE}│{Colors.RESET}")
-        output_lines.append(f"{Colors.WHITE}│{Colors.RESET} Close:  {change_color}{Colors.BOLD}{close_price:>12,.2f}{Colors.RESET} {Colors.WHITE}│{Colors.RESET}")
-        output_lines.append(f"{Colors.WHITE}│{Colors.RESET} Change: {change_color}{change_arrow} {abs(price_change):>10,.2f} ({price_change_pct:+.2f}%){Colors.RESET} {Colors.WHITE}│{Colors.RESET}")
-        output_lines.append(f"{Colors.WHITE}│{Colors.RESET} Volume: {Colors.YELLOW}{volume:>12,.0f}{Colors.RESET} {Colors.WHITE}│{Colors.RESET}")
-        output_lines.append(f"{Colors.WHITE}└──────────────────────────────────────────────────────┘{Colors.RESET}\n")
+        write(_SUMMARY_TOP)
+        write(f"{_OPEN_ROW}{Colors.AQUA}{open_price:>12,.2f}{_BOX_END}\n")
+        write(f"{_HIGH_ROW}{Colors.GREEN}{high_price:>12,.2f}{_BOX_END}\n")
+        write(f"{_LOW_ROW}{Colors.RED}{low_price:>12,.2f}{_BOX_END}\n")
+        write(f"{_CLOSE_ROW}{change_color}{Colors.BOLD}{close_price:>12,.2f}{_BOX_END}\n")
+        write(f"{_CHANGE_ROW}{change_color}{change_arrow} {abs(price_change):>10,.2f} ({price_change_pct:+.2f}%){_BOX_END}\n")
+        write(f"{_VOLUME_ROW}{Colors.YELLOW}{volume:>12,.0f}{_BOX_END}\n")
+        write(_BOX_BOTTOM)
+        write("\n")
         
         # Simplified ASCII candlestick representation
-        output_lines.append(self._create_ascii_candle(
-            open_price, high_price, low_price, close_price, width=50
-        ))
+        self._write_ascii_candle(
+            out, open_price, high_price, low_price, close_price, width=50
+        )
+        write("\n")
         
         # Additional metrics if available
         if metrics:
-            output_lines.append(f"\n{Colors.WHITE}┌─ Technical Indicators ───────────────────────────────┐{Colors.RESET}")
+            write(_INDICATORS_TOP)
             
             # Directional bias
             bias = metrics.get('directional_bias', 'neutral')
             bias_color = Colors.GREEN if bias == 'bull' else (Colors.RED if bias == 'bear' else Colors.YELLOW)
-            output_lines.append(f"{Colors.WHITE}│{Colors.RESET} Bias:        {bias_color}{bias.upper():>10}{Colors.RESET} {Colors.WHITE}│{Colors.RESET}")
+            write(f"{_BOX_EDGE} Bias:        {bias_color}{bias.upper():>10}{_BOX_END}\n")
             
             # Volatility
             volatility = metrics.get('volatility', 0)
             vol_level = "HIGH" if volatility > 2 else ("MEDIUM" if volatility > 1 else "LOW")
             vol_color = Colors.RED if volatility > 2 else (Colors.YELLOW if volatility > 1 else Colors.GREEN)
-            output_lines.append(f"{Colors.WHITE}│{Colors.RESET} Volatility:  {vol_color}{vol_level:>10}{Colors.RESET} ({volatility:.2f}%) {Colors.WHITE}│{Colors.RESET}")
+            write(f"{_BOX_EDGE} Volatility:  {vol_color}{vol_level:>10}{Colors.RESET} ({volatility:.2f}%) {_BOX_EDGE}\n")
             
             # Price changes across timeframes
-            if 'price_change_1m' in metrics:
-                pc_1m = metrics['price_change_1m']
-                pc_color = Colors.GREEN if pc_1m >= 0 else Colors.RED
-                output_lines.append(f"{Colors.WHITE}│{Colors.RESET} Change 1m:   {pc_color}{pc_1m:>9.2f}%{Colors.RESET} {Colors.WHITE}│{Colors.RESET}")
-            
-            if 'price_change_5m' in metrics:
-                pc_5m = metrics['price_change_5m']
-                pc_color = Colors.GREEN if pc_5m >= 0 else Colors.RED
-                output_lines.append(f"{Colors.WHITE}│{Colors.RESET} Change 5m:   {pc_color}{pc_5m:>9.2f}%{Colors.RESET} {Colors.WHITE}│{Colors.RESET}")
-            
-            if 'price_change_15m' in metrics:
-                pc_15m = metrics['price_change_15m']
-                pc_color = Colors.GREEN if pc_15m >= 0 else Colors.RED
-                output_lines.append(f"{Colors.WHITE}│{Colors.RESET} Change 15m:  {pc_color}{pc_15m:>9.2f}%{Colors.RESET} {Colors.WHITE}│{Colors.RESET}")
-            
-            if 'price_change_1h' in metrics:
-                pc_1h = metrics['price_change_1h']
-                pc_color = Colors.GREEN if pc_1h >= 0 else Colors.RED
-                output_lines.append(f"{Colors.WHITE}│{Colors.RESET} Change 1h:   {pc_color}{pc_1h:>9.2f}%{Colors.RESET} {Colors.WHITE}│{Colors.RESET}")
+            for key, prefix in _PRICE_CHANGE_ROWS:
+                if key in metrics:
+                    pc = metrics[key]
+                    write(_PRICE_CHANGE_FMT.format(prefix, Colors.GREEN if pc >= 0 else Colors.RED, pc))
             
-            output_lines.append(f"{Colors.WHITE}└──────────────────────────────────────────────────────┘{Colors.RESET}")
+            write(_BOX_BOTTOM)
         
         # Footer with timestamp
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        output_lines.append(f"\n{Colors.GRAY}Last updated: {timestamp}{Colors.RESET}")
-        output_lines.append(f"{Colors.AQUA}{'═' * width}{Colors.RESET}\n")
+        write(f"\n{Colors.GRAY}Last updated: {_timestamp_str()}")
+        write(footer_tail)
         
-        return "\n".join(output_lines)
+        return out.getvalue()
     
-    def _create_ascii_candle(self, open_price: float, high_price: float,
+    def _write_ascii_candle(self, out: io.StringIO, open_price: float, high_price: float,
                             low_price: float, close_price: float, 
-                            width: int = 50) -> str:
+                            width: int = 50) -> None:
         """
-        Create a simplified ASCII candlestick representation
+        Write a simplified ASCII candlestick representation into `out`
         
         Args:
+            out: Buffer the candle is written into
             open_price: Opening price
             high_price: High price
             low_price: Low price
             close_price: Closing price
             width: Width of the chart
-            
-        Returns:
-            ASCII art candlestick
         """
         is_bullish = close_price >= open_price
         
@@ -224,10 +331,13 @@ class CandlestickChart:
         if price_range == 0:
             price_range = 1
         
+        # Hoisted scale factors: rows per unit price and price per row
+        rows_per_price = chart_height / price_range
+        price_step = price_range / chart_height
+        
         def price_to_row(price):
             """Convert price to row position"""
-            normalized = (high_price - price) / price_range
-            return int(normalized * chart_height)
+            return int((high_price - price) * rows_per_price)
         
         # Get row positions
         high_row = 0
@@ -239,48 +349,33 @@ class CandlestickChart:
         body_top = min(open_row, close_row)
         body_bottom = max(open_row, close_row)
         
-        # Build the ASCII chart
-        lines = []
-        color = Colors.GREEN if is_bullish else Colors.RED
-        
-        lines.append(f"{Colors.WHITE}┌─ ASCII Candle ───────────────────────────────────────┐{Colors.RESET}")
-        
-        for row in range(chart_height + 1):
-            # Price label
-            row_price = high_price - (row / chart_height) * price_range
-            
-            # Build the candle
-            if row == high_row or row == low_row:
-                # Wick endpoints
-                candle = f"{color}    │{Colors.RESET}"
-            elif row > high_row and row < body_top:
-                # Upper wick
-                candle = f"{color}    │{Colors.RESET}"
-            elif row >= body_top and row <= body_bottom:
-                # Body
-                if is_bullish:
-                    candle = f"{Colors.GREEN}  ┃━┃{Colors.RESET}"
-                else:
-                    candle = f"{Colors.RED}  ┃█┃{Colors.RESET}"
-            elif row > body_bottom and row < low_row:
-                # Lower wick
-                candle = f"{color}    │{Colors.RESET}"
-            else:
-                candle = "      "
-            
-            # Add price label
-            if row % 3 == 0:  # Show price every 3 rows
-                lines.append(f"{Colors.WHITE}│{Colors.RESET} {row_price:>8,.2f} {candle}  {Colors.WHITE}│{Colors.RESET}")
+        # Classify every row once, then emit pre-coloured segments
+        row_kinds = [
+            _SEG_WICK if row == high_row or row == low_row
+            else _SEG_WICK if high_row < row < body_top
+            else _SEG_BODY if body_top <= row <= body_bottom
+            else _SEG_WICK if body_bottom < row < low_row
+            else _SEG_BLANK
+            for row in range(chart_height + 1)
+        ]
+        segments = _CANDLE_SEG[is_bullish]
+        
+        write = out.write
+        write(_CANDLE_TOP)
+        
+        for row, kind in enumerate(row_kinds):
+            # Show price label every 3 rows
+            if row % 3 == 0:
+                row_price = high_price - row * price_step
+                write(f"{_BOX_EDGE} {row_price:>8,.2f} ")
             else:
-                lines.append(f"{Colors.WHITE}│{Colors.RESET}          {candle}  {Colors.WHITE}│{Colors.RESET}")
+                write(_CANDLE_UNLABELLED)
+            write(segments[kind])
         
-        lines.append(f"{Colors.WHITE}└──────────────────────────────────────────────────────┘{Colors.RESET}")
+        write(_BOX_BOTTOM)
         
         # Add legend
-        legend = f"   {Colors.GREEN}█{Colors.RESET} Bullish  {Colors.RED}█{Colors.RESET} Bearish"
-        lines.append(legend)
-        
-        return "\n".join(lines)
+        write(_LEGEND)
     
     def render_multi_symbol(self, symbols: List[str], market_data: Dict[str, Any],
                            interval: Any = 60) -> str:
@@ -301,46 +396,78 @@ class CandlestickChart:
         else:
             interval_str = interval
             
-        output_lines = []
-        
-        output_lines.append(f"\n{Colors.AQUA}{'═' * 80}{Colors.RESET}")
-        output_lines.append(f"{Colors.AQUA}{Colors.BOLD}📊 Multi-Symbol View - {interval_str.upper()}{Colors.RESET}")
-        output_lines.append(f"{Colors.AQUA}{'═' * 80}{Colors.RESET}\n")
-        
+        out = io.StringIO()
+        write = out.write
+        
+        rule = self._rule(80)
+        write(f"\n{rule}\n")
+        write(f"{_AQUA_BOLD}📊 Multi-Symbol View - {interval_str.upper()}{Colors.RESET}\n")
+        write(f"{rule}\n\n")
+        
+        # Pass 1: resolve each symbol to either a message line or an OHLC row
+        rows: List[Tuple[str, Optional[str]]] = []
+        opens: List[float] = []
+        closes: List[float] = []
+        all_symbol_data = market_data.get("symbols", {})
         for symbol in symbols:
-            if "symbols" not in market_data or symbol not in market_data["symbols"]:
-                output_lines.append(f"{Colors.RED}❌ {symbol}: Not found{Colors.RESET}\n")
+            symbol_data = all_symbol_data.get(symbol)
+            if symbol_data is None:
+                rows.append((symbol, f"{Colors.RED}❌ {symbol}: Not found{Colors.RESET}\n\n"))
                 continue
             
-            symbol_data = market_data["symbols"][symbol]
-            
             # Try to get OHLC data with both formats (string and integer)
             ohlc = None
-            if "ohlc" in symbol_data:
-                ohlc = symbol_data["ohlc"].get(interval_str) or symbol_data["ohlc"].get(interval)
+            symbol_ohlc = symbol_data.get("ohlc")
+            if symbol_ohlc is not None:
+                ohlc = symbol_ohlc.get(interval_str) or symbol_ohlc.get(interval)
             
             if not ohlc:
-                output_lines.append(f"{Colors.YELLOW}⚠️  {symbol}: No {interval_str} data{Colors.RESET}\n")
+                rows.append((symbol, f"{Colors.YELLOW}⚠️  {symbol}: No {interval_str} data{Colors.RESET}\n\n"))
                 continue
                 
-            open_price = float(ohlc.get('open', 0))
-            close_price = float(ohlc.get('close', 0))
-            
-            change = close_price - open_price
-            change_pct = (change / open_price * 100) if open_price > 0 else 0
+            rows.append((symbol, None))
+            opens.append(ohlc.get('open', 0.0))
+            closes.append(ohlc.get('close', 0.0))
+        
+        # Pass 2: compute changes for all symbols at once
+        open_arr = np.asarray(opens, dtype=float)
+        close_arr = np.asarray(closes, dtype=float)
+        change_arr = close_arr - open_arr
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pct_arr = np.where(open_arr > 0, change_arr / open_arr * 100, 0.0)
+        prices = iter(zip(close_arr.tolist(), change_arr.tolist(), pct_arr.tolist()))
+        
+        # Pass 3: format in the requested symbol order
+        for symbol, message in rows:
+            if message is not None:
+                write(message)
+                continue
             
+            close_price, change, change_pct = next(prices)
             color = Colors.GREEN if change >= 0 else Colors.RED
             arrow = "▲" if change >= 0 else "▼"
             
-            output_lines.append(
+            cached = _CLOSE_FMT_CACHE.get(symbol)
+            if cached is not None and cached[0] == close_price:
+                close_str = cached[1]
+            else:
+                close_str = format(close_price, '>10,.2f')
+                _CLOSE_FMT_CACHE[symbol] = (close_price, close_str)
+            
+            write(
                 f"{Colors.WHITE}{symbol:>10}{Colors.RESET} │ "
-                f"{color}{close_price:>10,.2f}{Colors.RESET} │ "
-                f"{color}{arrow} {abs(change):>8,.2f} ({change_pct:+.2f}%){Colors.RESET}"
+                f"{color}{close_str}{Colors.RESET} │ "
+                f"{color}{arrow} {abs(change):>8,.2f} ({change_pct:+.2f}%){Colors.RESET}\n"
             )
         
-        output_lines.append(f"\n{Colors.AQUA}{'═' * 80}{Colors.RESET}\n")
+        write(f"\n{rule}\n")
         
-        return "\n".join(output_lines)
+        return out.getvalue()
+
+    def render_multi_symbol_bytes(self, symbols: List[str], market_data: Dict[str, Any],
+                                  interval: Any = 60) -> bytes:
+        """Multi-symbol comparison view as UTF-8 bytes. See render_multi_symbol()."""
+        return self.render_multi_symbol(symbols, market_data, interval).encode('utf-8')
 
 
 def create_chart(symbol: str, interval: int = 60) -> str:
@@ -354,18 +481,9 @@ def create_chart(symbol: str, interval: int = 60) -> str:
     Returns:
         Rendered chart string
     """
-    from src.data_layer.aggregator.fetch_data import get_market_data_from_cache
-    from src.data_layer.aggregator.worker import InMemoryCache
-    
-    # Interval mapping for display
-    interval_map = {
-        60: '1m',
-        120: '2m',
-        300: '5m',
-        900: '15m',
-        3600: '1h'
-    }
-    interval_str = interval_map.get(interval, f"{interval}s")
+    interval_str = _INTERVAL_MAP.get(interval, f"{interval}s")
+    if InMemoryCache is None:
+        return f"{Colors.RED}❌ Failed to create chart: market data cache is not available{Colors.RESET}"
     
     try:
         # Get cache instance
@@ -380,6 +498,17 @@ def create_chart(symbol: str, interval: int = 60) -> str:
         if not ohlc_data:
             return f"{Colors.YELLOW}⚠️  No {interval_str} OHLC data available for {symbol}{Colors.RESET}\n{Colors.GRAY}Tip: Make sure the market stream is running and the symbol is being tracked.{Colors.RESET}"
         
+        # Reuse a recent render if neither the candle nor the last price moved
+        cache_key = (
+            symbol, interval,
+            ohlc_data.get('timestamp'), ohlc_data.get('close'),
+            metrics.last_price if metrics else None
+        )
+        now = time.monotonic()
+        cached = _RENDER_CACHE.get(cache_key)
+        if cached and now - cached[0] < _RENDER_CACHE_TTL:
+            return cached[1]
+        
         # Build market data structure expected by chart renderer
         market_data = {
             "timestamp": datetime.now().isoformat(),
@@ -408,9 +537,13 @@ def create_chart(symbol: str, interval: int = 60) -> str:
         if tick_data:
             market_data["symbols"][symbol]["last_tick"] = tick_data
         
-        # Create and render chart (pass integer interval, render method will handle conversion)
-        chart = CandlestickChart()
-        return chart.render(symbol, market_data, interval)
+        # Render chart (pass integer interval, render method will handle conversion)
+        chart = _CHART_RENDERER.render(symbol, market_data, interval)
+        
+        if len(_RENDER_CACHE) >= _RENDER_CACHE_MAX:
+            _RENDER_CACHE.clear()
+        _RENDER_CACHE[cache_key] = (now, chart)
+        return chart
         
     except Exception as e:
         logger.error(f"Error creating chart for {symbol}: {e}", exc_info=True)
@@ -428,17 +561,9 @@ def create_multi_symbol_chart(symbols: List[str], interval: int = 60) -> str:
     Returns:
         Rendered comparison chart string
     """
-    from src.data_layer.aggregator.worker import InMemoryCache
-    
-    # Interval mapping for display
-    interval_map = {
-        60: '1m',
-        120: '2m',
-        300: '5m',
-        900: '15m',
-        3600: '1h'
-    }
-    interval_str = interval_map.get(interval, f"{interval}s")
+    interval_str = _INTERVAL_MAP.get(interval, f"{interval}s")
+    if InMemoryCache is None:
+        return f"{Colors.RED}❌ Failed to create multi-symbol chart: market data cache is not available{Colors.RESET}"
     
     try:
         # Get cache instance
@@ -460,10 +585,30 @@ def create_multi_symbol_chart(symbols: List[str], interval: int = 60) -> str:
                     }
                 }
         
-        # Create and render chart
-        chart = CandlestickChart()
-        return chart.render_multi_symbol(symbols, market_data, interval)
+        # Render chart
+        return _CHART_RENDERER.render_multi_symbol(symbols, market_data, interval)
         
     except Exception as e:
         logger.error(f"Error creating multi-symbol chart: {e}", exc_info=True)
         return f"{Colors.RED}❌ Failed to create multi-symbol chart: {str(e)}{Colors.RESET}"
+
+
+def write_chart(chart: Union[str, bytes], fp: Optional[BinaryIO] = None) -> None:
+    """
+    Write a composed chart frame with one write() and one flush()
+
+    Prefer this over print(chart): a line-buffered text stdout may flush on
+    every embedded newline, i.e. ~40 write syscalls per frame.
+
+    Args:
+        chart: Frame from render()/render_bytes() (or the multi-symbol variants)
+        fp: Binary stream to write to (defaults to sys.stdout.buffer)
+    """
+    if fp is None:
+        sys.stdout.flush()  # Keep ordering with text already printed
+        fp = sys.stdout.buffer
+    fp.write(chart.encode('utf-8') if isinstance(chart, str) else chart)
+    fp.flush()
+
+# Shared renderer; CandlestickChart holds no per-render state
+_CHART_RENDERER = CandlestickChart()
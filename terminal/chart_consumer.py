@@ -5,7 +5,8 @@ Consumes tick data from Redis and aggregates it into candles for the live chart
 
 import logging
 import threading
-from typing import Dict, List, Optional, Callable
+from collections import deque
+from typing import Deque, Dict, List, Optional, Callable
 from datetime import datetime, timedelta
 
 from data_layer.market_stream.redis_stream_consumer import RedisStreamConsumer
@@ -35,9 +36,17 @@ class ChartDataConsumer(RedisStreamConsumer):
         )
         self.symbol = symbol
         self.interval_seconds = interval_seconds
+        # Single writer (the consumer thread) / single reader (the UI thread):
+        # completed candles go into a bounded deque and the partial candle is
+        # published by plain reference assignment, so neither side takes a lock.
         self.current_candle: Optional[CandleData] = None
-        self.candles: List[CandleData] = []
-        self.data_lock = threading.Lock()
+        self._current_bucket_ts: int = -1  # Interval bucket id of current_candle
+        # Completed candles; the deque drops the oldest in O(1) once full
+        self.candles: Deque[CandleData] = deque(maxlen=1000)
+        # Bumped after every change to the candles, so readers can skip redraws
+        self.version = 0
+        # Set on every change; the reader clears it before it reads
+        self.new_data = threading.Event()
         
         # Reset consumer group to fetch historical data
         try:
@@ -62,8 +71,7 @@ class ChartDataConsumer(RedisStreamConsumer):
         Process incoming tick and update current candle
         """
         try:
-            with self.data_lock:
-                self._update_candle(tick)
+            self._update_candle(tick)
             return True
         except Exception as e:
             logger.error(f"Error processing tick for chart: {e}")
@@ -72,41 +80,60 @@ class ChartDataConsumer(RedisStreamConsumer):
     def _update_candle(self, tick: TickData):
         """Update current candle with new tick data"""
         tick_time = tick.timestamp
+        # Cast once at ingestion so everything downstream can trust float prices
+        price = float(tick.quote)
         
-        # Calculate candle start time (floor to nearest interval)
-        timestamp_ts = tick_time.timestamp()
-        candle_start_ts = (timestamp_ts // self.interval_seconds) * self.interval_seconds
-        candle_start_time = datetime.fromtimestamp(candle_start_ts)
+        # Interval bucket of the tick (floor to nearest interval); comparing the
+        # integer id avoids building a datetime for every tick
+        bucket = int(tick_time.timestamp() // self.interval_seconds)
         
-        if self.current_candle and self.current_candle.timestamp == candle_start_time:
-            # Update existing candle
-            self.current_candle.high = max(self.current_candle.high, tick.quote)
-            self.current_candle.low = min(self.current_candle.low, tick.quote)
-            self.current_candle.close = tick.quote
-            self.current_candle.volume = (self.current_candle.volume or 0) + 1 # Count ticks as volume
+        current = self.current_candle
+        if current and bucket == self._current_bucket_ts:
+            # Update existing candle: build the new values and publish them in
+            # one reference store, so the reader never sees a half-updated candle
+            self.current_candle = CandleData(
+                timestamp=current.timestamp,
+                symbol=current.symbol,
+                open=current.open,
+                high=max(current.high, price),
+                low=min(current.low, price),
+                close=price,
+                volume=(current.volume or 0) + 1 # Count ticks as volume
+            )
         else:
-            # Close previous candle if exists
-            if self.current_candle:
-                self.candles.append(self.current_candle)
-                # Keep buffer size manageable
-                if len(self.candles) > 1000:
-                    self.candles.pop(0)
+            # Close previous candle if exists (append before publishing the new
+            # one; get_candles relies on this order)
+            if current:
+                self.candles.append(current)
             
             # Start new candle
+            self._current_bucket_ts = bucket
             self.current_candle = CandleData(
-                timestamp=candle_start_time,
+                timestamp=datetime.fromtimestamp(bucket * self.interval_seconds),
                 symbol=self.symbol,
-                open=tick.quote,
-                high=tick.quote,
-                low=tick.quote,
-                close=tick.quote,
+                open=price,
+                high=price,
+                low=price,
+                close=price,
                 volume=1
             )
+        self.version += 1
+        self.new_data.set()
             
     def get_candles(self) -> List[CandleData]:
         """Get all completed candles plus current partial candle"""
-        with self.data_lock:
-            result = list(self.candles)
-            if self.current_candle:
-                result.append(self.current_candle)
-            return result
+        # Read the partial candle first: if it rolls over while the deque is
+        # being copied, its (newer) final version is already the last
+        # completed candle, so it is matched by timestamp, not identity.
+        current = self.current_candle
+        while True:
+            try:
+                result = list(self.candles)
+                break
+            except RuntimeError:
+                # The consumer thread appended mid-copy (deque mutated during
+                # iteration); the next attempt sees the longer deque
+                continue
+        if current and not (result and result[-1].timestamp == current.timestamp):
+            result.append(current)
+        return result
@@ -3,42 +3,42 @@ Trado Terminal CLI
 Main command-line interface for the trading system
 """
 
+import os
 import sys
+import atexit
 import logging
 import threading
 import time
 from typing import Optional
 
-from terminal.command_parser import CommandParser, CommandType
+from terminal.command_parser import CommandParser
 from terminal.formatter import ResponseFormatter, Colors
-from terminal.live_chart import start_live_chart, LiveChart
 from broker.factory import ExecutionServiceFactory
 from broker.interfaces import OrderRequest, OrderSide, OrderType, OrderStatus
 from data_layer.market_stream.stream import MarketStream
 from risk_manager.risk_manager import RiskManager
-from data_layer.historical_data_provider import YFinanceDataProvider
-from backtester.engine import PlaybackEngine
-from terminal.playback_consumer import PlaybackChartConsumer
-from backtester.backtest_engine import BacktestEngine
-from backtester.execution_simulator import ExecutionSimulator
-from strategy_engine.momentum_strategy import MomentumStrategy
 
 try:
-    from data_layer.dhan_data_provider import DhanDataProvider
-    from data_layer.dhan_backtest_adapter import DhanBacktestAdapter
-    HAS_DHAN = True
+    import readline
+    HAS_READLINE = True
 except ImportError:
-    HAS_DHAN = False
-from datetime import datetime, timedelta
-import yaml
+    HAS_READLINE = False
 
-# Set up logging
+# Set up logging (INFO and below only with TRADO_DEBUG set)
 logging.basicConfig(
-    level=logging.INFO,
+    level=logging.INFO if os.environ.get('TRADO_DEBUG') else logging.WARNING,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+_PROMPT = f"{Colors.AQUA}TRADER{Colors.RESET} ▶ "
+# Same prompt with the escape sequences marked non-printing for readline
+_READLINE_PROMPT = f"\001{Colors.AQUA}\002TRADER\001{Colors.RESET}\002 ▶ "
+_HISTORY_FILE = os.path.expanduser("~/.trado_history")
+
+# Replay interval strings to candle size in seconds
+_INTERVAL_SECONDS = {'1m': 60, '5m': 300, '15m': 900, '1h': 3600, '1d': 86400}
+
 
 class TradoTerminal:
     """Main terminal interface for Trado"""
@@ -50,17 +50,45 @@ class TradoTerminal:
 ╚══════════════════════════════════════════════════════════════╝{Colors.RESET}
 """
     
+    _HELP_ROWS = (
+        ("Command", "Description"),
+        ("/status", "Show system and account status"),
+        ("/buy <symbol> <amount>", "Place a buy order"),
+        ("/sell <symbol> <amount>", "Place a sell order"),
+        ("/risk", "Show risk management metrics"),
+        ("/live <symbol> [interval] [window_size]", "Open live chart with indicators"),
+        ("/replay [symbol] [days]", "Run visual backtest replay"),
+        ("/backtest [symbols...]", "Run headless statistical backtest"),
+        ("/exit", "Exit the terminal"),
+    )
+    
     def __init__(self):
         """Initialize the terminal with all components"""
         self.parser = CommandParser()
         self.formatter = ResponseFormatter()
         self.running = False
+        self._help_text: Optional[str] = None  # formatted on first /help
+        
+        # Command dispatch table keyed by command name (all handlers take the parser metadata)
+        self._handlers = {
+            'exit': self._handle_exit,
+            'help': self._show_help,
+            'status': self._show_status,
+            'buy': self._handle_buy,
+            'sell': self._handle_sell,
+            'replay': self._handle_replay,
+            'backtest': self._handle_backtest,
+            'risk': self._show_risk_status,
+            'live_chart': self._handle_live_chart,
+            'unknown': self._handle_unknown,
+        }
         
         # Initialize Core Components
         print(f"{Colors.GRAY}Initializing components...{Colors.RESET}")
         try:
             # Load Config
             with open("config/tradding_config.yaml", 'r') as f:
+                import yaml
                 self.config = yaml.safe_load(f)
 
             # Initialize Market Stream
@@ -76,6 +104,52 @@ class TradoTerminal:
         except Exception as e:
             print(self.formatter.format_alert("ERROR", f"Failed to initialize components: {e}"))
             # sys.exit(1) # Don't exit, let it fail gracefully or retry
+        
+        # Line editing, history and tab completion when attached to a terminal
+        self._interactive = HAS_READLINE and sys.stdin.isatty()
+        if self._interactive:
+            self._setup_readline()
+    
+    def _setup_readline(self):
+        """Configure readline completion and persistent history"""
+        symbols = (getattr(self, 'config', None) or {}).get('market_data', {}).get('symbols') or []
+        self._completions = sorted(set(self.parser.commands) | set(symbols))
+        readline.parse_and_bind('tab: complete')
+        readline.set_completer(self._complete)
+        readline.set_completer_delims(' \t\n')  # keep the leading '/' in the completed word
+        try:
+            readline.read_history_file(_HISTORY_FILE)
+        except (FileNotFoundError, PermissionError):
+            pass
+        atexit.register(self._save_history)
+    
+    @staticmethod
+    def _save_history():
+        """Write readline history on exit"""
+        try:
+            readline.write_history_file(_HISTORY_FILE)
+        except OSError as e:
+            logger.debug("Could not save history: %s", e)
+    
+    def _complete(self, text: str, state: int) -> Optional[str]:
+        """Readline completer over command names and configured symbols"""
+        if state == 0:
+            self._matches = [c for c in self._completions if c.startswith(text)]
+        return self._matches[state] if state < len(self._matches) else None
+    
+    def _read_line(self) -> Optional[str]:
+        """Read one line of user input; returns None at EOF"""
+        if self._interactive:
+            try:
+                return input(_READLINE_PROMPT)
+            except EOFError:
+                return None
+        sys.stdout.write(_PROMPT)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            return None
+        return line[:-1] if line.endswith('\n') else line
     
     def start(self):
         """Start the terminal loop"""
@@ -89,16 +163,20 @@ class TradoTerminal:
         while self.running:
             try:
                 # Get user input with colored prompt
-                prompt = f"{Colors.AQUA}TRADER{Colors.RESET} ▶ "
-                user_input = input(prompt)
+                user_input = self._read_line()
+                
+                # EOF (Ctrl-D or end of piped input)
+                if user_input is None:
+                    self._handle_exit()
+                    break
                 
                 # Skip empty input
                 if not user_input.strip():
                     continue
                 
                 # Parse command
-                command_type, metadata = self.parser.parse(user_input)
-                self._handle_command(command_type, metadata)
+                command, metadata = self.parser.parse_name(user_input)
+                self._handle_command(command, metadata)
                 
             except KeyboardInterrupt:
                 print("\n")
@@ -108,62 +186,44 @@ class TradoTerminal:
                 logger.error(f"Error in terminal loop: {e}")
                 print(self.formatter.format_alert("ERROR", str(e)))
 
-    def _handle_command(self, command_type: CommandType, metadata: dict):
+    def _handle_command(self, command: str, metadata: dict):
         """Route commands to appropriate handlers"""
-        
-        if command_type == CommandType.EXIT:
-            self._handle_exit()
-            
-        elif command_type == CommandType.HELP:
-            self._show_help()
-            
-        elif command_type == CommandType.STATUS:
-            self._show_status()
-            
-        elif command_type == CommandType.BUY:
-            self._handle_trade(metadata, is_buy=True)
-            
-        elif command_type == CommandType.SELL:
-            self._handle_trade(metadata, is_buy=False)
-            
-        elif command_type == CommandType.REPLAY:
-            self._handle_replay(metadata)
+        handler = self._handlers.get(command)
+        if handler:
+            handler(metadata)
 
-        elif command_type == CommandType.BACKTEST:
-             self._handle_backtest(metadata)
-            
-        elif command_type == CommandType.RISK:
-            self._show_risk_status()
-            
-        elif command_type == CommandType.LIVE_CHART:
-            self._handle_live_chart(metadata)
-            
-        elif command_type == CommandType.UNKNOWN:
-            print(self.formatter.format_alert("WARNING", f"Unknown command: {metadata.get('raw')}"))
+    def _handle_unknown(self, metadata: dict):
+        """Handle unrecognised input"""
+        print(self.formatter.format_alert("WARNING", f"Unknown command: {metadata.get('raw')}"))
 
-    def _handle_exit(self):
+    def _handle_exit(self, metadata: Optional[dict] = None):
         """Handle exit command"""
         print(f"\n{Colors.GRAY}Shutting down...{Colors.RESET}")
         self.running = False
         # self.broker.close() # If broker has a close method
 
-    def _show_help(self):
+    def _show_help(self, metadata: Optional[dict] = None):
         """Show help message"""
-        help_text = [
-            ["Command", "Description"],
-            ["/status", "Show system and account status"],
-            ["/buy <symbol> <amount>", "Place a buy order"],
-            ["/sell <symbol> <amount>", "Place a sell order"],
-            ["/risk", "Show risk management metrics"],
-            ["/live <symbol> [interval] [window_size]", "Open live chart with indicators"],
-            ["/replay [symbol] [days]", "Run visual backtest replay"],
-            ["/backtest [symbols...]", "Run headless statistical backtest"],
-            ["/exit", "Exit the terminal"]
-        ]
-        print("\n" + self.formatter.format_table(help_text[0], help_text[1:]))
+        if self._help_text is None:
+            self._help_text = "\n" + self.formatter.format_table(self._HELP_ROWS[0], self._HELP_ROWS[1:])
+        print(self._help_text)
 
     def _handle_backtest(self, metadata: dict):
         """Handle headless backtest command"""
+        # Backtest stack is imported on first use to keep terminal startup fast
+        from datetime import datetime, timedelta
+        from data_layer.historical_data_provider import YFinanceDataProvider
+        from backtester.engine import PlaybackEngine
+        from backtester.backtest_engine import BacktestEngine
+        from backtester.execution_simulator import ExecutionSimulator
+        from strategy_engine.momentum_strategy import MomentumStrategy
+        try:
+            from data_layer.dhan_data_provider import DhanDataProvider
+            from data_layer.dhan_backtest_adapter import DhanBacktestAdapter
+            HAS_DHAN = True
+        except ImportError:
+            HAS_DHAN = False
+        
         args = metadata.get('args', [])
         
         # Default settings
@@ -265,6 +325,8 @@ class TradoTerminal:
 
     def _handle_live_chart(self, metadata: dict):
         """Handle live chart command"""
+        from terminal.live_chart import start_live_chart
+        
         args = metadata.get('args', [])
         if not args:
             print(self.formatter.format_alert("ERROR", "Usage: /live <symbol> [interval_seconds] [window_size]"))
@@ -280,22 +342,23 @@ class TradoTerminal:
         except Exception as e:
             print(self.formatter.format_alert("ERROR", f"Failed to start chart: {e}"))
 
-    def _show_status(self):
+    def _show_status(self, metadata: Optional[dict] = None):
         """Show system status"""
         balance = self.execution_service.get_account_balance()
         positions = self.execution_service.get_active_positions()
         
-        print("\n" + self.formatter.format_status("Broker", "Active", {
+        broker_status = self.formatter.format_status("Broker", "Active", {
             "Connected": "Yes" if self.market_stream.is_connected else "No",
             "Balance": f"${balance:.2f}",
             "Open Positions": str(len(positions))
-        }))
-        print(self.formatter.format_status("Risk Manager", "Active", {
+        })
+        risk_status = self.formatter.format_status("Risk Manager", "Active", {
             "Daily Loss": f"${self.risk_manager.daily_loss}",
             "Trades Today": f"{self.risk_manager.daily_trades_count}"
-        }))
+        })
+        sys.stdout.write("\n" + broker_status + "\n" + risk_status + "\n")
 
-    def _show_risk_status(self):
+    def _show_risk_status(self, metadata: Optional[dict] = None):
         """Show detailed risk status"""
         print("\n" + self.formatter.format_status("Risk Metrics", "Active", {
             "Max Daily Loss": f"${self.risk_manager.max_daily_loss}",
@@ -304,6 +367,14 @@ class TradoTerminal:
             "Trades Today": f"{self.risk_manager.daily_trades_count}"
         }))
 
+    def _handle_buy(self, metadata: dict):
+        """Handle buy command"""
+        self._handle_trade(metadata, is_buy=True)
+
+    def _handle_sell(self, metadata: dict):
+        """Handle sell command"""
+        self._handle_trade(metadata, is_buy=False)
+
     def _handle_trade(self, metadata: dict, is_buy: bool):
         """Handle buy/sell commands"""
         args = metadata.get('args', [])
@@ -319,11 +390,11 @@ class TradoTerminal:
             return
 
         action = "BUY" if is_buy else "SELL"
-        print(f"{Colors.GRAY}Processing {action} order for {symbol}...{Colors.RESET}")
+        processing = f"{Colors.GRAY}Processing {action} order for {symbol}...{Colors.RESET}\n"
         
         # 1. Check Risk
         if not self.risk_manager.check_trade_allowed(amount):
-            print(self.formatter.format_alert("WARNING", "Trade rejected by Risk Manager"))
+            sys.stdout.write(processing + self.formatter.format_alert("WARNING", "Trade rejected by Risk Manager") + "\n")
             return
 
         # 2. Execute
@@ -343,14 +414,24 @@ class TradoTerminal:
             result = self.execution_service.execute_order(order)
             
             if result.status == OrderStatus.FILLED:
-                print(self.formatter.format_alert("SUCCESS", f"Order filled: {result.order_id} @ {result.average_price}"))
+                outcome = self.formatter.format_alert("SUCCESS", f"Order filled: {result.order_id} @ {result.average_price}")
             else:
-                print(self.formatter.format_alert("ERROR", f"Order failed: {result.error_message}"))
+                outcome = self.formatter.format_alert("ERROR", f"Order failed: {result.error_message}")
         except Exception as e:
-            print(self.formatter.format_alert("ERROR", f"Execution error: {e}"))
+            outcome = self.formatter.format_alert("ERROR", f"Execution error: {e}")
+        
+        # Progress line and outcome go out in one write
+        sys.stdout.write(processing + outcome + "\n")
 
     def _handle_replay(self, metadata: dict):
         """Handle visual backtest replay"""
+        # Replay stack is imported on first use to keep terminal startup fast
+        from datetime import datetime, timedelta
+        from data_layer.historical_data_provider import YFinanceDataProvider
+        from backtester.engine import PlaybackEngine
+        from terminal.playback_consumer import PlaybackChartConsumer
+        from terminal.live_chart import LiveChart
+        
         args = metadata.get('args', [])
         
         # Default values
@@ -392,8 +473,7 @@ class TradoTerminal:
             consumer = PlaybackChartConsumer(playback_engine, symbol)
             
             # Map interval string to seconds for LiveChart
-            interval_map = {'1m': 60, '5m': 300, '15m': 900, '1h': 3600, '1d': 86400}
-            interval_seconds = interval_map.get(interval, 3600)
+            interval_seconds = _INTERVAL_SECONDS.get(interval, 3600)
             
             chart = LiveChart(
                 symbol=symbol,
@@ -3,6 +3,8 @@ Command Parser for Trado Terminal
 Handles trader commands and user input parsing
 """
 
+import re
+from types import MappingProxyType
 from typing import Tuple, Optional, Dict, Any
 from enum import Enum
 
@@ -37,26 +39,31 @@ class CommandType(Enum):
     UNKNOWN = "unknown"
 
 
+_UNKNOWN = CommandType.UNKNOWN.value
+_TOKEN_RE = re.compile(r'\S+')
+
+
 class CommandParser:
     """Parse user commands and determine routing"""
     
-    def __init__(self):
-        self.commands = {
-            '/exit': CommandType.EXIT,
-            '/quit': CommandType.EXIT,
-            '/help': CommandType.HELP,
-            '/h': CommandType.HELP,
-            '/status': CommandType.STATUS,
-            '/s': CommandType.STATUS,
-            '/chart': CommandType.CHART,
-            '/live': CommandType.LIVE_CHART,
-            '/buy': CommandType.BUY,
-            '/sell': CommandType.SELL,
-            '/strategy': CommandType.STRATEGY,
-            '/risk': CommandType.RISK,
-            '/replay': CommandType.REPLAY,
-            '/backtest': CommandType.BACKTEST,
-        }
+    # Shared, read-only command table
+    commands = MappingProxyType({
+        '/exit': CommandType.EXIT,
+        '/quit': CommandType.EXIT,
+        '/help': CommandType.HELP,
+        '/h': CommandType.HELP,
+        '/status': CommandType.STATUS,
+        '/s': CommandType.STATUS,
+        '/chart': CommandType.CHART,
+        '/live': CommandType.LIVE_CHART,
+        '/buy': CommandType.BUY,
+        '/sell': CommandType.SELL,
+        '/strategy': CommandType.STRATEGY,
+        '/risk': CommandType.RISK,
+        '/replay': CommandType.REPLAY,
+        '/backtest': CommandType.BACKTEST,
+    })
+    _names = MappingProxyType({cmd: command_type.value for cmd, command_type in commands.items()})
     
     def parse(self, user_input: str) -> Tuple[CommandType, Dict[str, Any]]:
         """
@@ -68,14 +75,29 @@ class CommandParser:
         Returns:
             Tuple of (CommandType, metadata dict)
         """
-        if not user_input or not user_input.strip():
-            return CommandType.UNKNOWN, {'error': 'Empty input'}
+        name, metadata = self.parse_name(user_input)
+        return CommandType(name), metadata
+    
+    def parse_name(self, user_input: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        Parse user input and return the command name and metadata
+        
+        Same as parse() but yields the CommandType value string (e.g. 'exit'),
+        which is cheaper to hash for dispatch than the enum member.
         
-        parts = user_input.strip().split()
-        command = parts[0].lower()
-        args = parts[1:]
+        Args:
+            user_input: Raw user input string
+            
+        Returns:
+            Tuple of (command name, metadata dict)
+        """
+        # One scan tokenizes the whole line, surrounding whitespace included
+        tokens = _TOKEN_RE.findall(user_input) if user_input else None
+        if not tokens:
+            return _UNKNOWN, {'error': 'Empty input'}
         
-        if command in self.commands:
-            return self.commands[command], {'args': args, 'raw': user_input}
+        name = self._names.get(tokens[0].lower())
+        if name is None:
+            return _UNKNOWN, {'raw': user_input}
             
-        return CommandType.UNKNOWN, {'raw': user_input}
+        return name, {'args': tokens[1:], 'raw': user_input}
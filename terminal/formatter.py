@@ -3,8 +3,11 @@ Response Formatter for Trado Terminal
 Formats responses for clean terminal display
 """
 
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+import os
+import sys
+import time
+import functools
+from typing import Dict, Any, Optional, List, Tuple
 
 
 class Colors:
@@ -26,56 +29,98 @@ class Colors:
     BOLD = '\033[1m'
     DIM = '\033[2m'
     RESET = '\033[0m'
+    
+    @classmethod
+    def disable(cls):
+        """Blank every code; only affects strings built after the call"""
+        for name in list(vars(cls)):
+            if name.isupper():
+                setattr(cls, name, '')
+
+
+# Plain output for pipes, log files and NO_COLOR (https://no-color.org)
+if 'NO_COLOR' in os.environ or not sys.stdout.isatty():
+    Colors.disable()
+
+
+# Module-level aliases for the codes used on the formatting paths
+_BOLD, _RESET, _GRAY, _CYAN, _GREEN, _RED, _WHITE = (
+    Colors.BOLD, Colors.RESET, Colors.GRAY, Colors.CYAN, Colors.GREEN, Colors.RED, Colors.WHITE
+)
+
+_ALERT_COLORS = {
+    'INFO': Colors.CYAN,
+    'WARNING': Colors.YELLOW,
+    'ERROR': Colors.RED,
+    'SUCCESS': Colors.GREEN,
+}
 
 
 class ResponseFormatter:
     """Format responses for terminal display"""
     
+    # Colored "[LEVEL] " prefixes for the known alert levels
+    _ALERT_PREFIX = {
+        level: f"{color}{_BOLD}[{level}]{_RESET} "
+        for level, color in _ALERT_COLORS.items()
+    }
+    
+    # Last formatted "%H:%M:%S" timestamp and the second it was taken
+    _last_ts_sec = 0
+    _last_ts_str = ''
+    
+    @classmethod
+    def _timestamp(cls) -> str:
+        """Current local time as 'HH:MM:SS', cached per second"""
+        sec = int(time.time())
+        if sec != cls._last_ts_sec:
+            cls._last_ts_str = time.strftime("%H:%M:%S", time.localtime(sec))
+            cls._last_ts_sec = sec
+        return cls._last_ts_str
+    
     def format_status(self, component: str, status: str, details: Dict[str, Any] = None) -> str:
         """Format component status"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        color = Colors.GREEN if status.lower() == 'active' else Colors.RED
-        
-        output = [
-            f"{Colors.GRAY}[{timestamp}]{Colors.RESET} {Colors.BOLD}{component}{Colors.RESET}: {color}{status}{Colors.RESET}"
-        ]
-        
-        if details:
-            for key, value in details.items():
-                output.append(f"  {Colors.CYAN}{key}{Colors.RESET}: {value}")
-                
-        return "\n".join(output)
+        prefix = f"{_GRAY}[{self._timestamp()}]{_RESET} "
+        details_key = tuple(details.items()) if details else ()
+        try:
+            return prefix + self._format_status_body(component, status, details_key)
+        except TypeError:
+            # Unhashable detail values can't be memoized
+            return prefix + self._format_status_body.__wrapped__(component, status, details_key)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _format_status_body(component: str, status: str, details: Tuple[Tuple[str, Any], ...]) -> str:
+        """Everything in a status block after the timestamp, memoized on its inputs"""
+        color = _GREEN if status.lower() == 'active' else _RED
+        header = f"{_BOLD}{component}{_RESET}: {color}{status}{_RESET}"
+        if not details:
+            return header
+        return header + "\n" + "\n".join([f"  {_CYAN}{key}{_RESET}: {value}" for key, value in details])
 
     def format_table(self, headers: List[str], rows: List[List[str]]) -> str:
         """Format data as a table"""
         if not headers or not rows:
             return "No data"
             
-        # Calculate column widths
-        widths = [len(h) for h in headers]
-        for row in rows:
-            for i, cell in enumerate(row):
-                widths[i] = max(widths[i], len(str(cell)))
+        # Stringify every cell once, then size columns from the cached strings
+        str_rows = [[str(c) for c in row] for row in rows]
+        widths = [max(len(h), *(len(r[i]) for r in str_rows)) for i, h in enumerate(headers)]
         
-        # Create format string
-        fmt = "  ".join([f"{{:<{w}}}" for w in widths])
-        
-        output = []
-        output.append(Colors.BOLD + fmt.format(*headers) + Colors.RESET)
-        output.append(Colors.GRAY + "-" * (sum(widths) + 2 * (len(widths) - 1)) + Colors.RESET)
-        
-        for row in rows:
-            output.append(fmt.format(*[str(c) for c in row]))
+        # Left-justify each cell to its column width
+        sep = "  "
+        output = [
+            _BOLD + sep.join([h.ljust(w) for h, w in zip(headers, widths)]) + _RESET,
+            _GRAY + "-" * (sum(widths) + 2 * (len(widths) - 1)) + _RESET,
+        ]
+        output.extend([sep.join([c.ljust(w) for c, w in zip(r, widths)]) for r in str_rows])
             
         return "\n".join(output)
 
     def format_alert(self, level: str, message: str) -> str:
         """Format alert message"""
-        colors = {
-            'INFO': Colors.CYAN,
-            'WARNING': Colors.YELLOW,
-            'ERROR': Colors.RED,
-            'SUCCESS': Colors.GREEN
-        }
-        color = colors.get(level.upper(), Colors.WHITE)
-        return f"{color}{Colors.BOLD}[{level.upper()}]{Colors.RESET} {message}"
+        level = level.upper()
+        prefix = self._ALERT_PREFIX.get(level)
+        if prefix is None:
+            prefix = f"{_WHITE}{_BOLD}[{level}]{_RESET} "
+        return prefix + message
@@ -7,13 +7,18 @@ import time
 import sys
 import os
 import select
+import shutil
 import tty
 import termios
+import functools
+import re
+import unicodedata
+from types import MappingProxyType
 import yaml
 from typing import Optional, Any
-from datetime import datetime
 import threading
 import logging
+from collections import deque
 
 from terminal.plotter import TerminalPlotter
 from feature_engine.indicator_calculator import IndicatorCalculator
@@ -40,6 +45,93 @@ class Colors:
     MOVE_CURSOR_HOME = '\033[H'
 
 
+_CLEAR_HOME = Colors.CLEAR_SCREEN + Colors.MOVE_CURSOR_HOME
+_CLEAR_HOME_B = _CLEAR_HOME.encode('ascii')
+# Cursor home + erase to end of screen
+_HOME_CLEAR_B = b'\033[H\033[J'
+_HEADER_RULE = f"{Colors.AQUA}{'═' * 80}{Colors.RESET}"
+_STATS_RULE = f"{Colors.AQUA}{'─' * 80}{Colors.RESET}"
+
+# Static framing with %-slots for the per-chart / per-frame values
+_START_HEADER = (
+    f"{_CLEAR_HOME}\n"
+    f"{_HEADER_RULE}\n"
+    f"{Colors.AQUA}{Colors.BOLD}📊 LIVE CHART MODE (Redis Stream){Colors.RESET}\n"
+    f"{_HEADER_RULE}\n"
+    f"{Colors.WHITE}Symbol: {Colors.MAGENTA}%s{Colors.RESET}\n"
+    f"{Colors.WHITE}Interval: {Colors.AQUA}%s{Colors.RESET}\n"
+    f"{Colors.GRAY}Connecting to Redis stream...{Colors.RESET}\n"
+)
+_STATS_TEMPLATE = (
+    f"\n{_STATS_RULE}\n"
+    f"{Colors.BOLD} Price: {Colors.GREEN}%.2f{Colors.RESET} | "
+    f"Vol: {Colors.YELLOW}%s{Colors.RESET}\n"
+    f"{Colors.GRAY} Last Update: %s | Uptime: %s{Colors.RESET}\n"
+    f"{Colors.WHITE} Controls: [N]ext Indicator | [P]rev Indicator | [Q]uit{Colors.RESET}\n"
+    f"{_STATS_RULE}\n"
+)
+_EXIT_MESSAGE = f"\n{Colors.YELLOW}Exiting Live Chart...{Colors.RESET}\n"
+_WAITING_MESSAGE = f"{Colors.YELLOW}Waiting for data...{Colors.RESET}\n"
+_ERROR_TEMPLATE = f"{Colors.RED}Error: %s{Colors.RESET}\n"
+
+# How often to check for new consumer data while waiting for keys; also
+# the shortest gap between data-driven redraws, so tick bursts coalesce
+_DATA_CHECK_INTERVAL = 0.25
+
+# Interval display labels, keyed by interval in seconds
+_INTERVAL_MAP = MappingProxyType({
+    60: '1m',
+    120: '2m',
+    300: '5m',
+    900: '15m',
+    3600: '1h'
+})
+
+
+_FEATURE_CONFIG_PATH = "config/feature_config.yaml"
+
+
+@functools.lru_cache(maxsize=1)
+def _build_calculator(path: str, mtime: float) -> IndicatorCalculator:
+    """Calculator for a feature config file; mtime is only part of the cache key"""
+    with open(path, "r") as f:
+        return IndicatorCalculator(config=FeatureConfig.from_dict(yaml.safe_load(f)))
+
+
+def _load_calculator(path: str = _FEATURE_CONFIG_PATH) -> IndicatorCalculator:
+    """
+    IndicatorCalculator shared by all charts, rebuilt only when the config changes
+    
+    The calculator keeps no state between calls beyond its read-only config.
+    """
+    return _build_calculator(path, os.stat(path).st_mtime)
+
+
+_ANSI_ESCAPE = re.compile(r'\033\[[0-9;?]*[A-Za-z]')
+
+
+def _fits_screen(lines: list, term_size: os.terminal_size) -> bool:
+    """
+    Whether the frame fits the terminal without scrolling or wrapping
+    
+    One row is kept free for the cursor parked below the frame.
+    """
+    if len(lines) >= term_size.lines:
+        return False
+    columns = term_size.columns
+    for line in lines:
+        if len(line) <= columns and line.isascii():
+            continue
+        # Visible width: colour codes take no space, wide characters two cells
+        text = _ANSI_ESCAPE.sub('', line)
+        width = len(text) + sum(
+            1 for ch in text if ch >= '\u1100' and unicodedata.east_asian_width(ch) in 'WF'
+        )
+        if width > columns:
+            return False
+    return True
+
+
 class LiveChart:
     """
     Live auto-refreshing candlestick chart with indicators
@@ -67,29 +159,39 @@ class LiveChart:
         self.start_time = None
         self.last_update_time = None
         
+        # Shadow copy of the lines currently on screen, for partial redraws
+        self._last_frame_lines: list = []
+        self._last_term_size = None
+        # Output buffer reused across frames; grows to the largest frame seen
+        self._frame_buf = bytearray(8192)
+        
+        # Indicators for the last candle set seen (see _indicators_for)
+        self._ind_cache_key = None
+        self._ind_cache_val = None
+        self._ind_cache_head = ()
+        # Display-window slices, refilled in place for each new result
+        self._windowed_indicators: dict = {}
+        
+        # Signals collected from consumers that hand out only new ones
+        self._signals: deque = deque(maxlen=500)
+        
+        # What the chart on screen was rendered from (see _update_display)
+        self._rendered_state = None
+        self._rendered_chart = ""
+        self._rendered_candle: Optional[CandleData] = None
+        
         # Indicator Navigation State
         self.active_indicator_index = 0
         self.secondary_indicators = []
         
-        # Interval display mapping
-        self.interval_map = {
-            60: '1m',
-            120: '2m',
-            300: '5m',
-            900: '15m',
-            3600: '1h'
-        }
-        self.interval_str = self.interval_map.get(interval, f"{interval}s")
+        self.interval_str = _INTERVAL_MAP.get(interval, f"{interval}s")
         
         # Initialize components
         self.plotter = TerminalPlotter()
         
         # Load feature config
         try:
-            with open("config/feature_config.yaml", "r") as f:
-                config_dict = yaml.safe_load(f)
-                feature_config = FeatureConfig.from_dict(config_dict)
-                self.calculator = IndicatorCalculator(config=feature_config)
+            self.calculator = _load_calculator()
         except Exception as e:
             logger.warning(f"Failed to load feature config, using defaults: {e}")
             self.calculator = IndicatorCalculator()
@@ -106,15 +208,10 @@ class LiveChart:
     def start(self):
         """Start the live chart display"""
         self.is_running = True
-        self.start_time = datetime.now()
+        self.start_time = time.monotonic()
         
-        print(f"{Colors.CLEAR_SCREEN}{Colors.MOVE_CURSOR_HOME}")
-        print(f"{Colors.AQUA}{'═' * 80}{Colors.RESET}")
-        print(f"{Colors.AQUA}{Colors.BOLD}📊 LIVE CHART MODE (Redis Stream){Colors.RESET}")
-        print(f"{Colors.AQUA}{'═' * 80}{Colors.RESET}")
-        print(f"{Colors.WHITE}Symbol: {Colors.MAGENTA}{self.symbol}{Colors.RESET}")
-        print(f"{Colors.WHITE}Interval: {Colors.AQUA}{self.interval_str}{Colors.RESET}")
-        print(f"{Colors.GRAY}Connecting to Redis stream...{Colors.RESET}")
+        sys.stdout.write(_START_HEADER % (self.symbol, self.interval_str))
+        sys.stdout.flush()
         
         # Start Consumer
         try:
@@ -131,26 +228,37 @@ class LiveChart:
             # Set to cbreak mode (read char by char, no echo)
             tty.setcbreak(sys.stdin.fileno())
             
+            # Consumers that signal new data get redrawn as soon as it arrives
+            new_data = getattr(self.consumer, 'new_data', None)
+            
             while self.is_running:
+                if new_data is not None:
+                    new_data.clear()
                 self._update_display()
                 
-                # Responsive sleep loop
-                end_time = time.time() + self.refresh_rate
-                while time.time() < end_time and self.is_running:
-                    if self._is_key_pressed():
-                        key = sys.stdin.read(1)
-                        if key:
-                            if key.lower() == 'n': # Next
-                                self.active_indicator_index += 1
-                                break # Trigger immediate update
-                            elif key.lower() == 'p': # Previous
-                                self.active_indicator_index -= 1
-                                break # Trigger immediate update
-                            elif key.lower() == 'q': # Quit
-                                self.stop()
-                                return
-                    
-                    time.sleep(0.05) # Short sleep for responsiveness
+                # Block until a keypress, new data or the next refresh is due
+                deadline = time.monotonic() + self.refresh_rate
+                while self.is_running:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    if new_data is not None:
+                        remaining = min(remaining, _DATA_CHECK_INTERVAL)
+                    ready, _, _ = select.select([sys.stdin], [], [], remaining)
+                    if not ready:
+                        if new_data is not None and new_data.is_set():
+                            break
+                        continue
+                    key = sys.stdin.read(1).lower()
+                    if key == 'n': # Next
+                        self.active_indicator_index += 1
+                        break # Trigger immediate update
+                    elif key == 'p': # Previous
+                        self.active_indicator_index -= 1
+                        break # Trigger immediate update
+                    elif key == 'q': # Quit
+                        self.stop()
+                        return
                 
         except KeyboardInterrupt:
             self._handle_exit()
@@ -166,25 +274,28 @@ class LiveChart:
         self.is_running = False
         self.consumer.stop()
 
-    def _is_key_pressed(self):
-        return select.select([sys.stdin], [], [], 0) == ([sys.stdin], [], [])
-            
     def _update_display(self):
         """Update the chart display"""
         try:
+            # Nothing new since the last render: only the stats footer changes.
+            # The version is read before the candles so a racing update
+            # triggers a full render next time rather than being missed.
+            version = getattr(self.consumer, 'version', None)
+            state = (version, self.active_indicator_index, shutil.get_terminal_size())
+            if version is not None and state == self._rendered_state and self._last_frame_lines:
+                self._write_frame(self._rendered_chart + self._format_stats(self._rendered_candle))
+                return
+            
             # Get candles from consumer
             current_candles = self.consumer.get_candles()
             
             if not current_candles:
-                print(f"{Colors.YELLOW}Waiting for data...{Colors.RESET}")
+                sys.stdout.write(_WAITING_MESSAGE)
+                self._last_frame_lines = []
                 return
 
-            # Calculate indicators
-            indicators = self.calculator.calculate_indicators(current_candles)
-            
-            # Filter Secondary Indicators
-            all_keys = sorted(indicators.keys())
-            self.secondary_indicators = [k for k in all_keys if not self.plotter.is_overlay(k)]
+            # Calculate indicators (reused while the candles are unchanged)
+            indicators, indicators_windowed, self.secondary_indicators = self._indicators_for(current_candles)
             
             active_secondary = None
             if self.secondary_indicators:
@@ -194,55 +305,176 @@ class LiveChart:
             
             # Get signals if available
             signals = []
-            if hasattr(self.consumer, 'get_signals'):
+            if hasattr(self.consumer, 'get_new_signals'):
+                self._signals.extend(self.consumer.get_new_signals())
+                signals = self._signals
+            elif hasattr(self.consumer, 'get_signals'):
                 signals = self.consumer.get_signals()
 
             # Render chart
             chart_output = self.plotter.render(
                 self.symbol, 
                 current_candles[-self.window_size:], # Show last n candles
-                {k: v[-self.window_size:] for k, v in indicators.items()},
+                indicators_windowed,
                 self.interval_str,
                 active_secondary_indicator=active_secondary,
                 signals=signals
             )
             
-            # Clear screen and display
-            # Use a more robust clear sequence
-            sys.stdout.write(f"{Colors.CLEAR_SCREEN}{Colors.MOVE_CURSOR_HOME}")
-            sys.stdout.write(chart_output)
-            sys.stdout.flush()
-            
-            # Display stats
-            self._display_stats(current_candles[-1])
+            self._write_frame(chart_output + self._format_stats(current_candles[-1]))
+            self._rendered_state = (version, self.active_indicator_index, state[2])
+            self._rendered_chart = chart_output
+            self._rendered_candle = current_candles[-1]
             
             self.update_count += 1
-            self.last_update_time = datetime.now()
+            self.last_update_time = time.monotonic()
             
         except Exception as e:
             logger.error(f"Error updating live chart: {e}", exc_info=True)
             # Don't crash, just print error
-            print(f"{Colors.RED}Error: {str(e)}{Colors.RESET}")
+            sys.stdout.write(_ERROR_TEMPLATE % e)
+            self._last_frame_lines = []
+    
+    def _indicators_for(self, candles: list):
+        """
+        Indicators, their display window and the secondary indicator names
+        
+        Memoized on the candle count and the last candle's values, so refresh
+        ticks with no new data skip the recomputation. When only the last
+        candle ticked, one candle was appended, or the buffer slid by one,
+        the previous result is extended incrementally instead of recomputed.
+        """
+        last = candles[-1]
+        key = (len(candles), last.timestamp, last.open, last.high, last.low, last.close, last.volume)
+        if key == self._ind_cache_key:
+            return self._ind_cache_val
+        
+        indicators = None
+        previous = self._ind_cache_val[0] if self._ind_cache_val else None
+        if previous:
+            prefix = self._incremental_prefix(candles, previous)
+            if prefix is not None:
+                indicators = self.calculator.update(candles, prefix)
+        if indicators is None:
+            indicators = self.calculator.calculate_indicators(candles)
+        
+        indicators_windowed = self._windowed_indicators
+        for k, v in indicators.items():
+            window = indicators_windowed.get(k)
+            if window is None:
+                indicators_windowed[k] = v[-self.window_size:]
+            else:
+                window[:] = v[-self.window_size:]
+        if len(indicators_windowed) != len(indicators):
+            for k in [k for k in indicators_windowed if k not in indicators]:
+                del indicators_windowed[k]
+        secondary = [k for k in sorted(indicators) if not self.plotter.is_overlay(k)]
+        self._ind_cache_key = key
+        self._ind_cache_val = (indicators, indicators_windowed, secondary)
+        self._ind_cache_head = tuple(c.timestamp for c in candles[:2])
+        return self._ind_cache_val
+    
+    def _incremental_prefix(self, candles: list, previous: dict) -> Optional[dict]:
+        """
+        Cached indicators trimmed to line up with candles[:-1], or None
+        
+        Relies on the indicators being causal: values for earlier candles do
+        not depend on later ones.
+        """
+        old_len = self._ind_cache_key[0]
+        old_last = self._ind_cache_key[1:]
+        first_ts = candles[0].timestamp
+        
+        # Last candle ticked in place
+        if len(candles) == old_len and first_ts == self._ind_cache_head[0] and candles[-1].timestamp == old_last[0]:
+            return {k: v[:-1] for k, v in previous.items()}
+        
+        # A new candle arrived: the previous last candle must be unchanged
+        prev = candles[-2]
+        if (prev.timestamp, prev.open, prev.high, prev.low, prev.close, prev.volume) != old_last:
+            return None
+        if len(candles) == old_len + 1 and first_ts == self._ind_cache_head[0]:
+            return previous
+        if len(candles) == old_len and len(self._ind_cache_head) > 1 and first_ts == self._ind_cache_head[1]:
+            # Bounded buffer dropped its oldest candle
+            return {k: v[1:] for k, v in previous.items()}
+        return None
     
-    def _display_stats(self, last_candle: CandleData):
-        """Display live chart statistics"""
+    def _write_frame(self, frame: str):
+        """
+        Write a frame with a single stdout write, redrawing only changed lines
+        
+        The screen is cleared and fully repainted on the first frame, after
+        anything else was printed, when the terminal is resized, and whenever
+        the frame does not fit the terminal (the diff addresses absolute rows,
+        which no longer line up once the frame scrolls or lines wrap).
+        """
+        lines = frame.split('\n')
+        if lines and not lines[-1]:
+            lines.pop()
+        
+        term_size = shutil.get_terminal_size()
+        previous = self._last_frame_lines
+        if not _fits_screen(lines, term_size):
+            parts = [_HOME_CLEAR_B, frame.encode('utf-8')]
+        elif not previous or term_size != self._last_term_size:
+            parts = [_CLEAR_HOME_B, frame.encode('utf-8')]
+        else:
+            parts = [
+                b"\033[%d;1H\033[2K" % row + line.encode('utf-8')
+                for row, line in enumerate(lines, 1)
+                if row > len(previous) or line != previous[row - 1]
+            ]
+            # Erase leftovers of a longer previous frame and park the cursor below
+            parts.append(b"\033[%d;1H" % (len(lines) + 1))
+            if len(previous) > len(lines):
+                parts.append(b"\033[J")
+        
+        self._emit(parts)
+        self._last_frame_lines = lines
+        self._last_term_size = term_size
+    
+    def _emit(self, parts: list):
+        """
+        Copy encoded frame parts into the reusable frame buffer and write it once
+        
+        Bytes go straight to the binary stdout, as chart.write_chart does;
+        streams without one (e.g. StringIO) get the decoded text.
+        """
+        size = sum(map(len, parts))
+        if size > len(self._frame_buf):
+            self._frame_buf = bytearray(max(size, 2 * len(self._frame_buf)))
+        
+        with memoryview(self._frame_buf) as view:
+            pos = 0
+            for part in parts:
+                view[pos:pos + len(part)] = part
+                pos += len(part)
+            
+            out = getattr(sys.stdout, 'buffer', None)
+            if out is None:
+                sys.stdout.write(str(view[:pos], 'utf-8'))
+                sys.stdout.flush()
+            else:
+                sys.stdout.flush()  # Keep ordering with text already printed
+                out.write(view[:pos])
+                out.flush()
+    
+    def _format_stats(self, last_candle: CandleData) -> str:
+        """Format the live chart statistics panel"""
         if not self.start_time:
-            return
+            return ""
         
-        uptime = datetime.now() - self.start_time
-        uptime_str = str(uptime).split('.')[0]
-        last_update = datetime.now().strftime("%H:%M:%S")
+        minutes, seconds = divmod(int(time.monotonic() - self.start_time), 60)
+        hours, minutes = divmod(minutes, 60)
+        uptime_str = "%d:%02d:%02d" % (hours, minutes, seconds)
+        last_update = time.strftime("%H:%M:%S")
         
-        print(f"\n{Colors.AQUA}{'─' * 80}{Colors.RESET}")
-        print(f"{Colors.BOLD} Price: {Colors.GREEN}{last_candle.close:.2f}{Colors.RESET} | "
-              f"Vol: {Colors.YELLOW}{last_candle.volume}{Colors.RESET}")
-        print(f"{Colors.GRAY} Last Update: {last_update} | Uptime: {uptime_str}{Colors.RESET}")
-        print(f"{Colors.WHITE} Controls: [N]ext Indicator | [P]rev Indicator | [Q]uit{Colors.RESET}")
-        print(f"{Colors.AQUA}{'─' * 80}{Colors.RESET}")
+        return _STATS_TEMPLATE % (last_candle.close, last_candle.volume, last_update, uptime_str)
 
     def _handle_exit(self):
         """Handle graceful exit"""
-        print(f"\n{Colors.YELLOW}Exiting Live Chart...{Colors.RESET}\n")
+        print(_EXIT_MESSAGE)
 
 def start_live_chart(symbol: str, interval: int = 60, refresh_rate: float = 1.0, market_stream: Optional[MarketStream] = None, window_size: int = 60):
     """
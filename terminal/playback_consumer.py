@@ -1,5 +1,8 @@
 import logging
-from typing import List, Optional, Dict
+import threading
+from collections import deque
+from itertools import islice
+from typing import Deque, List, Optional, Dict
 from common.models import CandleData, SignalEvent
 from backtester.engine import PlaybackEngine
 
@@ -14,8 +17,17 @@ class PlaybackChartConsumer:
     def __init__(self, playback_engine: PlaybackEngine, symbol: str):
         self.playback_engine = playback_engine
         self.symbol = symbol
-        self.candles: List[CandleData] = []
-        self.signals: List[SignalEvent] = []
+        # Bounded buffers; LiveChart only asks for window_size, we keep more just in case
+        self.candles: Deque[CandleData] = deque(maxlen=2000)
+        self.signals: Deque[SignalEvent] = deque(maxlen=500)
+        # Signals received so far / handed out by get_new_signals
+        self._signal_total = 0
+        self._signal_cursor = 0
+        self._signal_lock = threading.Lock()
+        # Bumped after every new candle or signal, so readers can skip redraws
+        self.version = 0
+        # Set on every new candle or signal; the reader clears it before it reads
+        self.new_data = threading.Event()
         
         # Register callback
         self.playback_engine.register_candle_callback(self._on_candle)
@@ -27,17 +39,17 @@ class PlaybackChartConsumer:
         """Callback for new candles from playback engine"""
         if symbol == self.symbol:
             self.candles.append(candle)
-            # Keep a reasonable buffer, though LiveChart only asks for window_size
-            # We keep more just in case, but prevent infinite growth
-            if len(self.candles) > 2000:
-                self.candles.pop(0)
+            self.version += 1
+            self.new_data.set()
     
     def _on_signal(self, signal: SignalEvent):
         """Callback for new signals"""
         if signal.symbol == self.symbol:
-            self.signals.append(signal)
-            if len(self.signals) > 500:
-                self.signals.pop(0)
+            with self._signal_lock:
+                self.signals.append(signal)
+                self._signal_total += 1
+            self.version += 1
+            self.new_data.set()
                 
     def get_candles(self) -> List[CandleData]:
         """Return the current list of candles"""
@@ -46,6 +58,17 @@ class PlaybackChartConsumer:
     def get_signals(self) -> List[SignalEvent]:
         """Return the current list of signals"""
         return list(self.signals)
+    
+    def get_new_signals(self) -> List[SignalEvent]:
+        """Return the signals received since the previous call, oldest first"""
+        with self._signal_lock:
+            new = min(self._signal_total - self._signal_cursor, len(self.signals))
+            self._signal_cursor = self._signal_total
+            if new <= 0:
+                return []
+            recent = list(islice(reversed(self.signals), new))
+        recent.reverse()
+        return recent
         
     def start(self):
         """
@@ -4,8 +4,11 @@ Renders candlestick charts and technical indicators in the terminal
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+import functools
+import sys
+from typing import List, Dict, Any, Optional, BinaryIO
 from datetime import datetime
+import numpy as np
 import pandas as pd
 
 try:
@@ -17,6 +20,10 @@ from common.models import CandleData, SignalEvent
 
 logger = logging.getLogger(__name__)
 
+# Above this many candles per column of width, candles are aggregated
+# into buckets before plotting (plotext cannot draw more than one per column)
+_DOWNSAMPLE_FACTOR = 2
+
 class TerminalPlotter:
     """
     Handles plotting of market data and indicators using plotext
@@ -25,10 +32,13 @@ class TerminalPlotter:
     def __init__(self):
         if plt is None:
             logger.warning("plotext not installed. Charting will be disabled.")
+        # Last (inputs, output) of each chart panel, see _panel
+        self._panels: Dict[str, tuple] = {}
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def is_overlay(name: str) -> bool:
-        """Check if indicator should be overlaid on price chart"""
+        """Check if indicator should be overlaid on price chart (cached per name)"""
         name_upper = name.upper()
         
         # Exclude specific types that might match keywords but have different scales
@@ -47,93 +57,151 @@ class TerminalPlotter:
         """
         Render the chart with candles and indicators
         """
+        return "\n".join(self._render_parts(
+            symbol, candles, indicators, interval, width, height,
+            active_secondary_indicator, signals
+        ))
+    
+    def render_to(self, symbol: str, candles: List[CandleData],
+                  indicators: Dict[str, List[float]],
+                  interval: str = "1m", width: int = 100, height: int = 30,
+                  active_secondary_indicator: Optional[str] = None,
+                  signals: Optional[List[SignalEvent]] = None,
+                  fp: Optional[BinaryIO] = None) -> None:
+        """
+        Render the chart straight to a binary stream with a single flush
+        
+        Each panel is written as soon as it is built, into fp's own buffer
+        (sys.stdout.buffer by default), instead of print()ing the joined
+        string through the line-buffered text layer.
+        """
+        if fp is None:
+            sys.stdout.flush()  # Keep ordering with text already printed
+            fp = sys.stdout.buffer
+        for i, part in enumerate(self._render_parts(
+                symbol, candles, indicators, interval, width, height,
+                active_secondary_indicator, signals)):
+            if i:
+                fp.write(b"\n")
+            fp.write(part.encode('utf-8'))
+        fp.write(b"\n")
+        fp.flush()
+    
+    def _render_parts(self, symbol: str, candles: List[CandleData],
+                      indicators: Dict[str, List[float]],
+                      interval: str, width: int, height: int,
+                      active_secondary_indicator: Optional[str],
+                      signals: Optional[List[SignalEvent]]) -> List[str]:
+        """Build the chart panels (price, volume, secondary indicator)"""
         if plt is None:
-            return "Error: 'plotext' library not installed. Please install it via pip."
+            return ["Error: 'plotext' library not installed. Please install it via pip."]
             
         if not candles:
-            return "No data available to plot."
+            return ["No data available to plot."]
 
-        # Prepare data
-        dates = [self._format_date(c.timestamp) for c in candles]
-        opens = [c.open for c in candles]
-        highs = [c.high for c in candles]
-        lows = [c.low for c in candles]
-        closes = [c.close for c in candles]
-        volumes = [c.volume if c.volume else 0 for c in candles]
+        # Prepare data (one pass over the candles, then split into columns)
+        timestamps, opens, highs, lows, closes, volumes = map(list, zip(*[
+            (c.timestamp, c.open, c.high, c.low, c.close, c.volume or 0) for c in candles
+        ]))
+        format_date = self._format_date
+        dates = [format_date(ts) for ts in timestamps]
         
         # Identify Overlays
-        overlays = {}
-        for name, values in indicators.items():
-            if self.is_overlay(name):
-                overlays[name] = values
+        is_overlay = self.is_overlay
+        overlays = {name: list(values) for name, values in indicators.items() if is_overlay(name)}
+        markers = self._signal_markers(signals, timestamps, dates, closes) if signals else None
+        secondary_values = None
+        if active_secondary_indicator and active_secondary_indicator in indicators:
+            secondary_values = list(indicators[active_secondary_indicator])
         
-        output_parts = []
+        # Far more candles than columns: plot OHLC buckets instead. Signal
+        # markers were placed on the full data; plotext positions them by time.
+        n = len(candles)
+        if n > width * _DOWNSAMPLE_FACTOR:
+            starts = np.arange(0, n, n // width)
+            ends = np.append(starts[1:], n) - 1
+            dates = [dates[i] for i in starts]
+            opens = np.asarray(opens, dtype=float)[starts].tolist()
+            highs = np.maximum.reduceat(np.asarray(highs, dtype=float), starts).tolist()
+            lows = np.minimum.reduceat(np.asarray(lows, dtype=float), starts).tolist()
+            closes = np.asarray(closes, dtype=float)[ends].tolist()
+            volumes = np.add.reduceat(np.asarray(volumes, dtype=float), starts).tolist()
+            # Indicators aligned to the candles take the value at each bucket's close
+            last_in_bucket = ends.tolist()
+            overlays = {
+                name: [values[i] for i in last_in_bucket] if len(values) == n else values
+                for name, values in overlays.items()
+            }
+            if secondary_values is not None and len(secondary_values) == n:
+                secondary_values = [secondary_values[i] for i in last_in_bucket]
         
-        # --- 1. Price Chart (with Overlays) ---
+        # Each panel is rebuilt only when its own inputs changed, so e.g.
+        # switching the secondary indicator leaves price and volume alone
+        output_parts = [self._panel(
+            'price', (symbol, interval, width, dates, opens, highs, lows, closes, overlays, markers),
+            lambda: self._plot_price_chart(symbol, interval, width, dates, opens, highs, lows, closes, overlays, markers)
+        )]
+        
+        # --- 2. Volume Chart (skipped for OHLC-only data) ---
+        if any(volumes):
+            output_parts.append(self._panel(
+                'volume', (width, dates, volumes),
+                lambda: self._plot_volume(width, dates, volumes)
+            ))
+        
+        # --- 3. Active Secondary Indicator ---
+        if secondary_values is not None:
+            output_parts.append(self._panel(
+                'secondary', (active_secondary_indicator, width, dates, secondary_values),
+                lambda: self._plot_secondary_indicator(active_secondary_indicator, width, dates, secondary_values)
+            ))
+            
+        return output_parts
+    
+    def _panel(self, name: str, key: tuple, draw) -> str:
+        """Return the cached chunk for a panel if its inputs are unchanged, else draw it"""
+        cached = self._panels.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        chunk = draw()
+        self._panels[name] = (key, chunk)
+        return chunk
+    
+    @staticmethod
+    def _start_panel(title: str):
+        """Reset the plotext figure for a new panel"""
         plt.clear_figure()
         plt.theme('dark')
-        plt.title(f"{symbol} - Price ({interval})")
+        plt.title(title)
         plt.date_form('H:M')
+    
+    def _plot_price_chart(self, symbol: str, interval: str, width: int, dates: List[str],
+                          opens: List[float], highs: List[float], lows: List[float], closes: List[float],
+                          overlays: Dict[str, List[float]], markers: Optional[tuple]) -> str:
+        """Price panel: candles, overlay indicators and signal markers"""
+        # --- 1. Price Chart (with Overlays) ---
+        self._start_panel(f"{symbol} - Price ({interval})")
         
         plt.candlestick(dates, data={
             'Open': opens, 'High': highs, 'Low': lows, 'Close': closes
         }, colors=['green', 'red'])
         
         # Plot Overlays
+        plot = plt.plot
         for name, values in overlays.items():
-            # Filter None values for plotting
-            clean_values = [v if (v is not None and v != 0) else None for v in values]
+            # Only plot if we have valid data (anything but None/0), checked
+            # before building the scrubbed copy
+            if not any(values):
+                continue
             # Simple color rotation or logic
             color = 'yellow' if 'EMA' in name else 'blue'
             if 'BB' in name: color = 'white'
-            # Only plot if we have valid data
-            if any(v is not None for v in clean_values):
-                plt.plot(dates, clean_values, label=name, color=color)
+            # None/0 become gaps
+            plot(dates, [v or None for v in values], label=name, color=color)
         
         # Plot Signals
-        if signals:
-            # Map signals to current dates
-            # We need to find which signals correspond to the visible candles
-            # This is approximate as signals have timestamps
-            
-            buy_dates = []
-            buy_prices = []
-            sell_dates = []
-            sell_prices = []
-            
-            # Create a lookup for candle timestamps
-            candle_ts_map = {c.timestamp: c for c in candles}
-            
-            for signal in signals:
-                # Find closest candle or exact match
-                # For simplicity, we check if signal timestamp is in our visible range
-                if not candles: continue
-                
-                if candles[0].timestamp <= signal.timestamp <= candles[-1].timestamp:
-                    # Find the corresponding candle (or closest)
-                    # Since we formatted dates as H:M, we need to match that
-                    formatted_date = self._format_date(signal.timestamp)
-                    
-                    # Check if this date is in our x-axis
-                    if formatted_date in dates:
-                        # Use the candle's close or the signal's price if available
-                        # SignalEvent doesn't strictly have price, but usually it's close
-                        price = 0
-                        if signal.candle and 'close' in signal.candle:
-                            price = signal.candle['close']
-                        else:
-                            # Fallback to finding the candle in our list
-                            # This is O(N), could be optimized
-                            idx = dates.index(formatted_date)
-                            price = closes[idx]
-                        
-                        if 'buy' in signal.signal_type.lower() or 'bullish' in signal.signal_type.lower():
-                            buy_dates.append(formatted_date)
-                            buy_prices.append(price * 0.995) # Slightly below
-                        elif 'sell' in signal.signal_type.lower() or 'bearish' in signal.signal_type.lower():
-                            sell_dates.append(formatted_date)
-                            sell_prices.append(price * 1.005) # Slightly above
-
+        if markers:
+            buy_dates, buy_prices, sell_dates, sell_prices = markers
             if buy_dates:
                 plt.scatter(buy_dates, buy_prices, marker="triangle", color="green", label="Buy Signal")
             if sell_dates:
@@ -141,52 +209,100 @@ class TerminalPlotter:
 
         plt.plot_size(width, 20) # Give price more space
         try:
-            output_parts.append(plt.build())
+            return plt.build()
         except IndexError:
-            output_parts.append("Error building price chart")
+            return "Error building price chart"
+    
+    def _signal_markers(self, signals: List[SignalEvent], timestamps: list,
+                        dates: List[str], closes: List[float]) -> tuple:
+        """Buy/sell marker positions for the signals inside the visible candles"""
+        # Map signals to current dates
+        # We need to find which signals correspond to the visible candles
+        # This is approximate as signals have timestamps
         
-        # --- 2. Volume Chart ---
-        plt.clear_figure()
-        plt.theme('dark')
-        plt.title("Volume")
-        plt.date_form('H:M')
+        buy_dates = []
+        buy_prices = []
+        sell_dates = []
+        sell_prices = []
+        
+        # x-axis label -> close; reversed so the first candle per label wins
+        date_to_close = dict(zip(reversed(dates), reversed(closes)))
+        
+        # Visible time range (candles is non-empty here)
+        first_ts, last_ts = timestamps[0], timestamps[-1]
+        signal_side = self._signal_side
+        
+        for signal in signals:
+            # Find closest candle or exact match
+            # For simplicity, we check if signal timestamp is in our visible range
+            if first_ts <= signal.timestamp <= last_ts:
+                # Find the corresponding candle (or closest)
+                # Since we formatted dates as H:M, we need to match that
+                formatted_date = self._format_date(signal.timestamp)
+                
+                # Check if this date is in our x-axis (close of its candle)
+                candle_close = date_to_close.get(formatted_date)
+                if candle_close is not None:
+                    # Use the candle's close or the signal's price if available
+                    # SignalEvent doesn't strictly have price, but usually it's close
+                    if signal.candle and 'close' in signal.candle:
+                        price = signal.candle['close']
+                    else:
+                        price = candle_close
+                    
+                    side = signal_side(signal.signal_type)
+                    if side == 'buy':
+                        buy_dates.append(formatted_date)
+                        buy_prices.append(price * 0.995) # Slightly below
+                    elif side == 'sell':
+                        sell_dates.append(formatted_date)
+                        sell_prices.append(price * 1.005) # Slightly above
         
+        return buy_dates, buy_prices, sell_dates, sell_prices
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _signal_side(signal_type: str) -> Optional[str]:
+        """'buy', 'sell' or None for a signal type (cached; types are a small set)"""
+        signal_type = signal_type.lower()
+        if 'buy' in signal_type or 'bullish' in signal_type:
+            return 'buy'
+        if 'sell' in signal_type or 'bearish' in signal_type:
+            return 'sell'
+        return None
+    
+    def _plot_volume(self, width: int, dates: List[str], volumes: List[float]) -> str:
+        """Volume bar panel"""
+        self._start_panel("Volume")
         plt.bar(dates, volumes, color='blue')
         plt.plot_size(width, 8)
-        output_parts.append(plt.build())
+        return plt.build()
+    
+    def _plot_secondary_indicator(self, name: str, width: int, dates: List[str], values: List[float]) -> str:
+        """Panel for the active non-overlay indicator"""
+        self._start_panel(f"Indicator: {name}")
         
-        # --- 3. Active Secondary Indicator ---
-        if active_secondary_indicator and active_secondary_indicator in indicators:
-            values = indicators[active_secondary_indicator]
-            
-            plt.clear_figure()
-            plt.theme('dark')
-            plt.title(f"Indicator: {active_secondary_indicator}")
-            plt.date_form('H:M')
-            
-            # Handle None/0
-            plot_values = [v if (v is not None and v != 0) else None for v in values]
-            
-            # Color logic
-            color = 'magenta'
-            if 'RSI' in active_secondary_indicator.upper(): color = 'cyan'
-            elif 'MACD' in active_secondary_indicator.upper(): color = 'yellow'
-            
-            plt.plot(dates, plot_values, color=color)
-            
-            # RSI Reference lines
-            if 'RSI' in active_secondary_indicator.upper():
-                plt.ylim(0, 100)
-                plt.plot(dates, [70]*len(dates), color='red')
-                plt.plot(dates, [30]*len(dates), color='green')
+        # Handle None/0
+        plot_values = [v or None for v in values]
+        
+        # Color logic
+        name_upper = name.upper()
+        is_rsi = 'RSI' in name_upper
+        color = 'magenta'
+        if is_rsi: color = 'cyan'
+        elif 'MACD' in name_upper: color = 'yellow'
+        
+        plt.plot(dates, plot_values, color=color)
+        
+        # RSI Reference lines
+        if is_rsi:
+            plt.ylim(0, 100)
+            plt.hline(70, color='red')
+            plt.hline(30, color='green')
 
-            plt.plot_size(width, 10)
-            output_parts.append(plt.build())
-            
-        return "\n".join(output_parts)
-            
-        return "\n".join(output_parts)
+        plt.plot_size(width, 10)
+        return plt.build()
 
     def _format_date(self, dt: datetime) -> str:
-        """Format datetime for x-axis"""
-        return dt.strftime('%H:%M')
+        """Format datetime for x-axis (same as strftime('%H:%M'), without the locale round trip)"""
+        return '%02d:%02d' % (dt.hour, dt.minute)
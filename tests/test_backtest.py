@@ -2,7 +2,10 @@ import logging
 from datetime import datetime, timedelta
 import sys
 import os
-import random
+import unittest
+
+import numpy as np
+import pandas as pd
 
 # Add current directory to path so imports work
 sys.path.append(os.getcwd())
@@ -12,6 +15,7 @@ from backtester.execution_simulator import ExecutionSimulator
 from backtester.backtest_engine import BacktestEngine
 # from data_layer.historical_data_provider import YFinanceDataProvider
 from strategy_engine.simple_strategy import SimpleStrategy
+from strategy_engine.momentum_strategy import MomentumStrategy
 from backtester.reporter import BacktestReporter
 from common.models import CandleData
 
@@ -20,25 +24,24 @@ logging.basicConfig(level=logging.INFO)
 
 class MockDataProvider:
     def __init__(self):
-        pass
+        self.rng = np.random.default_rng()
         
     def get_candles(self, symbol, start, end, interval):
-        candles = []
-        current = start
-        price = 100.0
-        while current <= end:
-            price = price * (1 + random.uniform(-0.01, 0.01))
-            candles.append(CandleData(
-                timestamp=current,
+        # Hourly random walk, generated in one go
+        n = int((end - start) / timedelta(hours=1)) + 1
+        prices = 100.0 * (1 + self.rng.uniform(-0.01, 0.01, n)).cumprod()
+        return [
+            CandleData(
+                timestamp=start + timedelta(hours=i),
                 symbol=symbol,
                 open=price,
                 high=price * 1.01,
                 low=price * 0.99,
                 close=price,
                 volume=1000
-            ))
-            current += timedelta(hours=1)
-        return candles
+            )
+            for i, price in enumerate(prices.tolist())
+        ]
         
     def candle_to_ticks(self, candle):
         from data_layer.market_stream.models import TickData
@@ -89,9 +92,7 @@ def run_test():
     engine.start()
     
     # Wait for completion (PlaybackEngine runs in a thread)
-    import time
-    while playback.get_state().value == "playing":
-        time.sleep(0.1)
+    playback.wait_until_done(timeout=60)
         
     # 6. Results
     stats = execution.get_execution_statistics()
@@ -103,5 +104,79 @@ def run_test():
     report_path = reporter.generate_report(stats, "SimpleStrategy")
     print(f"\nReport generated at: {report_path}")
 
+class TestMomentumBatch(unittest.TestCase):
+    """on_candles must emit the same signals as feeding every row through on_candle"""
+
+    @staticmethod
+    def _make_data():
+        # Three days of 15m bars (09:00-17:45): a quiet range, a breakout at
+        # 12:00, then day 1 holds into 16:00 (EOD exit), day 2 reverses (stop
+        # loss) and day 3 rallies past +4R before pulling back (trailing stop)
+        rng = np.random.default_rng(7)
+        timestamps = [
+            datetime(2024, 1, 1, 9) + timedelta(days=day, minutes=15 * i)
+            for day in range(3) for i in range(36)
+        ]
+        moves = [{12: 1.0}, {12: 1.0, 14: 1.5, 15: 1.5, 17: -4.0},
+                 {12: 1.0, 14: 2.0, 15: 2.0, 16: 2.0, 17: -0.5}]
+        close = np.empty(len(timestamps))
+        level = 100.0
+        for i in range(len(timestamps)):
+            day, bar = divmod(i, 36)
+            level += moves[day].get(bar, 0.0)
+            close[i] = level + rng.normal(0, 0.05)
+        open_ = np.r_[close[0], close[:-1]]
+        df_candles = pd.DataFrame({
+            'open': open_,
+            'high': np.maximum(open_, close) + 0.5,
+            'low': np.minimum(open_, close) - 0.5,
+            'close': close,
+            'volume': 1000.0,
+        }, index=pd.DatetimeIndex(timestamps))
+
+        high, low = df_candles['high'], df_candles['low']
+        df_features = pd.DataFrame({
+            'ROC_12': df_candles['close'].pct_change(12).fillna(0) * 100,
+            'ATRr_14': (high - low).rolling(14, min_periods=1).mean(),
+            'DonchianHigh_20': high.rolling(20, min_periods=1).max().shift(fill_value=high.iloc[0]),
+            'DonchianLow_20': low.rolling(20, min_periods=1).min().shift(fill_value=low.iloc[0]),
+            '15m_SMA_1': df_candles['close'],
+            '15m_EMA_20': df_candles['close'].ewm(span=20).mean(),
+            'SMA_1': df_candles['close'],
+            'Close': df_candles['close'],
+            'High': high,
+            'Low': low,
+        }, index=df_candles.index)
+        return df_candles, df_features
+
+    def test_on_candles_matches_on_candle(self):
+        df_candles, df_features = self._make_data()
+
+        strategy = MomentumStrategy()
+        incremental = []
+        for (timestamp, row), features in zip(df_candles.iterrows(), df_features.to_dict('records')):
+            candle = CandleData(
+                timestamp=timestamp.to_pydatetime(),
+                symbol='TEST',
+                open=row['open'],
+                high=row['high'],
+                low=row['low'],
+                close=row['close'],
+                volume=row['volume']
+            )
+            signal = strategy.on_candle(candle, features)
+            if signal:
+                incremental.append((signal.timestamp, signal.signal_type, signal.reason, signal.indicators['price']))
+
+        batch = [
+            (s.timestamp, s.signal_type, s.reason, s.indicators['price'])
+            for s in MomentumStrategy().on_candles(df_candles, df_features, symbol='TEST').itertuples()
+        ]
+
+        self.assertEqual(batch, incremental)
+        reasons = [reason for _, _, reason, _ in incremental]
+        self.assertIn("End of Day Exit", reasons)
+        self.assertTrue(any(reason.startswith("Stop Loss Hit") for reason in reasons))
+
 if __name__ == "__main__":
     run_test()
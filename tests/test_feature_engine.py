@@ -54,9 +54,9 @@ class TestIndicatorCalculator(unittest.TestCase):
         
         keys = list(indicators.keys())
         print(f"Custom keys: {keys}")
-        self.assertIn('SMA_10', keys)
-        self.assertIn('EMA_20', keys)
-        self.assertNotIn('rsi', keys)
+        self.assertIn('SMA_10', indicators)
+        self.assertIn('EMA_20', indicators)
+        self.assertNotIn('rsi', indicators)
 
     def test_multi_timeframe(self):
         # Config with 1h (base) and 2h
@@ -73,13 +73,37 @@ class TestIndicatorCalculator(unittest.TestCase):
         print(f"Multi-timeframe keys: {keys}")
         
         # Should have base SMA_10
-        self.assertIn('SMA_10', keys)
+        self.assertIn('SMA_10', indicators)
         # Should have 2h_SMA_10
-        self.assertIn('2h_SMA_10', keys)
+        self.assertIn('2h_SMA_10', indicators)
         
         # Check lengths
         self.assertEqual(len(indicators['SMA_10']), 200)
         self.assertEqual(len(indicators['2h_SMA_10']), 200)
 
+    def test_incremental_update(self):
+        config = FeatureConfig(
+            indicators=[
+                IndicatorConfig(name="sma", params={"length": 10}),
+                IndicatorConfig(name="ema", params={"length": 20}),
+                IndicatorConfig(name="rsi", params={"length": 14}),
+                IndicatorConfig(name="macd", params={"fast": 12, "slow": 26, "signal": 9})
+            ],
+            timeframes=[]
+        )
+        calculator = IndicatorCalculator(config=config)
+        previous = calculator.calculate_indicators(self.candles[:-1])
+        updated = calculator.update(self.candles, previous)
+        full = calculator.calculate_indicators(self.candles)
+        
+        self.assertEqual(list(updated.keys()), list(full.keys()))
+        for key in full:
+            np.testing.assert_allclose(updated[key], full[key], rtol=1e-9, atol=1e-9)
+        
+        # Higher-timeframe columns can't be extended incrementally
+        config.timeframes = ["2h"]
+        previous = calculator.calculate_indicators(self.candles[:-1])
+        self.assertIsNone(calculator.update(self.candles, previous))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,107 @@
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import io
+import re
+import unittest
+from unittest import mock
+
+from terminal.live_chart import LiveChart
+
+
+class Screen:
+    """Minimal VT100 screen: cursor moves, erases, line feeds, wrapping and scrolling"""
+
+    _CONTROL = re.compile(r'\033\[([0-9;?]*)([A-Za-z])|(\n)|(\r)|([^\033\n\r]+)')
+
+    def __init__(self, columns, lines):
+        self.columns = columns
+        self.lines = lines
+        self.rows = [[' '] * columns for _ in range(lines)]
+        self.row = self.col = 0
+
+    def _line_feed(self):
+        self.row += 1
+        if self.row == self.lines:
+            self.rows.pop(0)
+            self.rows.append([' '] * self.columns)
+            self.row -= 1
+
+    def feed(self, data):
+        for params, command, lf, cr, text in self._CONTROL.findall(data):
+            if lf:
+                self._line_feed()
+                self.col = 0
+            elif cr:
+                self.col = 0
+            elif text:
+                for ch in text:
+                    if self.col == self.columns:
+                        self._line_feed()
+                        self.col = 0
+                    self.rows[self.row][self.col] = ch
+                    self.col += 1
+            elif command == 'H':
+                row, _, col = params.partition(';')
+                self.row = int(row or 1) - 1
+                self.col = int(col or 1) - 1
+            elif command == 'J':
+                start = 0 if params == '2' else self.row + 1
+                if params != '2':
+                    self.rows[self.row][self.col:] = [' '] * (self.columns - self.col)
+                for r in range(start, self.lines):
+                    self.rows[r] = [' '] * self.columns
+            elif command == 'K':
+                self.rows[self.row] = [' '] * self.columns
+
+    def display(self):
+        return [''.join(r).rstrip() for r in self.rows]
+
+
+class TestWriteFrame(unittest.TestCase):
+    def setUp(self):
+        self.chart = LiveChart("TEST", 60, consumer=mock.Mock())
+
+    def _replay(self, frames, columns, lines):
+        """Screen after writing each frame in turn through _write_frame"""
+        screen = Screen(columns, lines)
+        size = os.terminal_size((columns, lines))
+        with mock.patch('terminal.live_chart.shutil.get_terminal_size', return_value=size):
+            for frame in frames:
+                out = io.StringIO()
+                with mock.patch('sys.stdout', out):
+                    self.chart._write_frame(frame)
+                screen.feed(out.getvalue())
+        return screen.display()
+
+    def _repaint(self, frame, columns, lines):
+        """Screen after a plain clear and full repaint of frame"""
+        screen = Screen(columns, lines)
+        screen.feed('\033[2J\033[H' + frame)
+        return screen.display()
+
+    def test_frame_taller_than_screen(self):
+        first = ''.join(f"\033[92mrow {i} first\033[0m\n" for i in range(40))
+        second = ''.join(f"\033[92mrow {i} {'second' if i % 3 else 'first'}\033[0m\n" for i in range(40))
+        self.assertEqual(self._replay([first, second], 80, 24), self._repaint(second, 80, 24))
+
+    def test_frame_wider_than_screen(self):
+        first = ''.join(f"{i:02d} " + '─' * 90 + "\n" for i in range(10))
+        second = ''.join(f"{i:02d} " + ('═' if i % 2 else '─') * 90 + "\n" for i in range(10))
+        self.assertEqual(self._replay([first, second], 80, 24), self._repaint(second, 80, 24))
+
+    def test_fitting_frame_redraws_changed_lines_only(self):
+        first = ''.join(f"row {i}\n" for i in range(10))
+        second = first.replace("row 4", "row 4 changed")
+        self.assertEqual(self._replay([first, second], 80, 24), self._repaint(second, 80, 24))
+
+        out = io.StringIO()
+        with mock.patch('terminal.live_chart.shutil.get_terminal_size', return_value=os.terminal_size((80, 24))), \
+                mock.patch('sys.stdout', out):
+            self.chart._write_frame(first)
+        self.assertEqual(out.getvalue(), "\033[5;1H\033[2Krow 4\033[11;1H")
+
+if __name__ == '__main__':
+    unittest.main()
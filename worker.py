@@ -3,11 +3,18 @@ import logging
 import time
 import argparse
 import threading
+from collections import defaultdict
 from typing import Dict, Any, List, Optional
 import json
 import signal
 import os
-from data_layer.market_stream import MarketStream
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -16,12 +23,36 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Import modules
+# The log format doesn't use thread/process fields; skip collecting them
+# for every record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Clear screen + cursor home, written directly instead of spawning clear/cls
+_CLEAR_SCREEN = '\033[2J\033[H'
+
+# Table layouts: row formatters (bound str.format) and their header + rule
+_MONITOR_ROW = "{:<20} {:<10} {:<15} {:<10} {:<15} {:<10}".format
+_MONITOR_HEADER = "\n" + _MONITOR_ROW(
+    "Worker Name", "Status", "Processed", "Dropped", "Queue Size", "Errors"
+) + "\n" + "-" * 80
+_STATUS_ROW = "{:<20} {:<10} {:<15} {:<10} {:<15}".format
+_STATUS_HEADER = "\n" + _STATUS_ROW(
+    "Worker Name", "Status", "Uptime", "Processed", "Errors"
+) + "\n" + "-" * 70
+_STREAM_HEADER = "Worker Name          Status     Uptime          Processed  Errors\n" + "-" * 80
+
+# Import modules (stream and aggregator modules are imported where the
+# default workers are built, so management commands don't load them)
 from data_layer.worker_manager import WorkerManager
-from data_layer.aggregator.worker import MarketAggregatorProcessor, AggregatorWorker
-from data_layer.market_stream import MarketStream
-from data_layer.market_stream.stream_worker import StreamWorker
-from data_layer.aggregator.market_aggregator import get_aggregator_instance
+
+
+def _read_json(path: str) -> Dict[str, Any]:
+    """Read and parse a JSON file (with orjson when installed)"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
 
 
 class WorkerCLI:
@@ -31,10 +62,43 @@ class WorkerCLI:
         """Initialize the CLI"""
         self.worker_manager = WorkerManager.get_instance()
         self.running = False
+        # Set to end run_demo (e.g. from the signal handler)
+        self._stop_event = threading.Event()
         self.demo_resources = {}
+        # Ticks seen per symbol, for sampling the demo log
+        self._tick_counts: Dict[str, int] = defaultdict(int)
+        self._log_listener = self._start_log_listener()
+    
+    def _start_log_listener(self) -> Optional[QueueListener]:
+        """
+        Route logging through a queue so worker threads never block on stderr
+        
+        The root logger's handlers are moved to a background listener thread
+        and replaced by a QueueHandler, which only enqueues each record.
+        Returns None if logging is already queued (e.g. by another WorkerCLI).
+        """
+        root = logging.getLogger()
+        if any(isinstance(h, QueueHandler) for h in root.handlers):
+            return None
+        log_queue = queue.Queue(-1)
+        listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+        root.handlers = [QueueHandler(log_queue)]
+        listener.start()
+        return listener
+    
+    def stop_logging(self) -> None:
+        """Flush queued log records, stop the listener thread and restore the handlers"""
+        if self._log_listener:
+            self._log_listener.stop()
+            logging.getLogger().handlers = list(self._log_listener.handlers)
+            self._log_listener = None
     
     def register_default_workers(self):
         """Register default workers for testing"""
+        from data_layer.market_stream import MarketStream
+        from data_layer.market_stream.stream_worker import StreamWorker
+        from data_layer.aggregator.worker import MarketAggregatorProcessor
+        
         # Register Stream Worker
         if not self._is_worker_registered("stream_worker"):
             logger.info("Registering stream worker...")
@@ -85,17 +149,19 @@ class WorkerCLI:
     
     def _is_worker_registered(self, name: str) -> bool:
         """Check if a worker is registered"""
-        status = self.worker_manager.get_all_worker_status()
-        return name in status
+        return self.worker_manager.is_registered(name)
     
     def _process_market_data(self, data: Dict[str, Any]):
         """Process market data (demo callback)"""
         symbol = data.get("symbol", "unknown")
-        price = data.get("price", 0.0)
         
-        # Log only every 10th tick to avoid flooding
-        if hash(f"{symbol}_{price}") % 10 == 0:
-            logger.info(f"Market data: {symbol} @ {price:.2f}")
+        # Log only every 10th tick per symbol to avoid flooding
+        count = self._tick_counts[symbol] = self._tick_counts[symbol] + 1
+        if count % 10 or not logger.isEnabledFor(logging.INFO):
+            return
+        
+        price = data.get("price", 0.0)
+        logger.info("Market data: %s @ %.2f", symbol, price)
     
     def start_worker(self, name: str) -> bool:
         """Start a worker by name"""
@@ -176,23 +242,19 @@ class WorkerCLI:
         # Start monitoring in worker manager
         self.worker_manager.start_monitoring(interval=interval)
         
+        if os.name == 'nt':
+            os.system('')  # Enables ANSI escape handling in the Windows console
+        
         try:
-            # Display headers
-            print("\n{:<20} {:<10} {:<15} {:<10} {:<15} {:<10}".format(
-                "Worker Name", "Status", "Processed", "Dropped", "Queue Size", "Errors"
-            ))
-            print("-" * 80)
-            
             # Monitor loop
             while self.running:
-                os.system('cls' if os.name == 'nt' else 'clear')
-                print(f"Worker Monitor - Press Ctrl+C to exit - {time.strftime('%H:%M:%S')}")
-                print("\n{:<20} {:<10} {:<15} {:<10} {:<15} {:<10}".format(
-                    "Worker Name", "Status", "Processed", "Dropped", "Queue Size", "Errors"
-                ))
-                print("-" * 80)
+                # The frame is built up and written in one go
+                lines = [
+                    f"{_CLEAR_SCREEN}Worker Monitor - Press Ctrl+C to exit - {time.strftime('%H:%M:%S')}",
+                    _MONITOR_HEADER
+                ]
                 
-                # Get all worker statuses
+                # Get all worker statuses (one snapshot per frame)
                 statuses = self.worker_manager.get_all_worker_status()
                 
                 for name, status in statuses.items():
@@ -203,10 +265,13 @@ class WorkerCLI:
                     queue_size = status.get("queue_size", 0)
                     errors = status.get("error_count", 0)
                     
-                    print("{:<20} {:<10} {:<15} {:<10} {:<15} {:<10}".format(
+                    lines.append(_MONITOR_ROW(
                         name, running_status, processed, dropped, queue_size, errors
                     ))
                 
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
+                
                 time.sleep(interval)
                 
         except KeyboardInterrupt:
@@ -225,26 +290,28 @@ class WorkerCLI:
             
             try:
                 import subprocess
-                # Run the stream worker script in background
-                env = os.environ.copy()
-                env['PYTHONPATH'] = os.getcwd()
+                # Run the stream worker script in background, in its own
+                # session so it is not hit by Ctrl+C in this terminal
+                cwd = os.getcwd()
+                pythonpath = os.environ.get('PYTHONPATH')
                 process = subprocess.Popen(
                     [sys.executable, "scripts/run_stream_worker.py"],
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.DEVNULL,
-                    cwd=os.getcwd(),
-                    env=env
+                    cwd=cwd,
+                    env={**os.environ, 'PYTHONPATH': cwd + os.pathsep + pythonpath if pythonpath else cwd},
+                    start_new_session=True
                 )
                 
-                # Give it a moment to start
-                time.sleep(2)
-                
-                # Check if process is still running
-                if process.poll() is None:
+                # Give it a moment to start; a worker that exits early
+                # (e.g. a startup error) is reported as soon as it does
+                try:
+                    process.wait(timeout=2)
+                    logger.error("Stream worker failed to start")
+                except subprocess.TimeoutExpired:
+                    # Still running
                     logger.info("Stream worker started successfully in background.")
                     logger.info("Use 'stream monitor' to monitor it, or 'stream stop' to stop it.")
-                else:
-                    logger.error("Stream worker failed to start")
                     
             except Exception as e:
                 logger.error(f"Error starting stream worker: {e}")
@@ -253,21 +320,27 @@ class WorkerCLI:
             STATUS_FILE = "/tmp/stream_worker_status.json"
             
             try:
-                if os.path.exists(STATUS_FILE):
-                    with open(STATUS_FILE, 'r') as f:
-                        status = json.load(f)
-                    
-                    pid = status.get("pid")
-                    if pid:
-                        logger.info(f"Stopping stream worker process {pid}...")
+                try:
+                    status = _read_json(STATUS_FILE)
+                except FileNotFoundError:
+                    logger.error("Stream worker status file not found")
+                    return
+                
+                pid = status.get("pid")
+                if pid:
+                    logger.info(f"Stopping stream worker process {pid}...")
+                    try:
                         os.kill(pid, signal.SIGTERM)
-                        # Remove status file
+                    except ProcessLookupError:
+                        # Worker died without cleaning up; the file is stale
                         os.remove(STATUS_FILE)
-                        logger.info("Stream worker stopped successfully")
-                    else:
-                        logger.error("No PID found in status file")
+                        logger.warning(f"Stream worker process {pid} was not running, removed stale status file")
+                        return
+                    # Remove status file
+                    os.remove(STATUS_FILE)
+                    logger.info("Stream worker stopped successfully")
                 else:
-                    logger.error("Stream worker status file not found")
+                    logger.error("No PID found in status file")
             except Exception as e:
                 logger.error(f"Error stopping stream worker: {e}")
         
@@ -299,35 +372,48 @@ class WorkerCLI:
             
             logger.info("Monitoring stream worker... (Press Ctrl+C to stop)")
             
+            last_seen = ()  # Never equal to a stat key, so the first pass prints
             try:
                 while True:
+                    # A stat is enough to tell whether the worker rewrote the
+                    # file; it is only re-read and printed when it changed
                     try:
-                        if os.path.exists(STATUS_FILE):
-                            with open(STATUS_FILE, 'r') as f:
-                                status = json.load(f)
-                            
-                            running = status.get("running", False)
-                            connected = status.get("connected", False)
-                            subscriptions = status.get("subscriptions", 0)
-                            uptime = status.get("uptime_seconds", 0)
-                            
-                            print(f"Worker Name          Status     Uptime          Processed  Errors")
-                            print("-" * 80)
-                            print(f"stream_worker        {'RUNNING' if running else 'STOPPED'}    {uptime:.0f}s              0          0")
-                            print(f"\nStream Status: Connected={connected}, Subscriptions={subscriptions}")
-                        else:
-                            print("Worker Name          Status     Uptime          Processed  Errors")
-                            print("-" * 80)
+                        st = os.stat(STATUS_FILE)
+                        file_key = (st.st_mtime_ns, st.st_size)
+                    except FileNotFoundError:
+                        file_key = None
+                    
+                    if file_key != last_seen:
+                        last_seen = file_key
+                        try:
+                            if file_key is not None:
+                                status = _read_json(STATUS_FILE)
+                                
+                                running = status.get("running", False)
+                                connected = status.get("connected", False)
+                                subscriptions = status.get("subscriptions", 0)
+                                uptime = status.get("uptime_seconds", 0)
+                                
+                                print(_STREAM_HEADER)
+                                print(f"stream_worker        {'RUNNING' if running else 'STOPPED'}    {uptime:.0f}s              0          0")
+                                print(f"\nStream Status: Connected={connected}, Subscriptions={subscriptions}")
+                            else:
+                                print(_STREAM_HEADER)
+                                print("stream_worker        STOPPED    0s              0          0")
+                                print("\nStream Status: Not running")
+                        
+                        except FileNotFoundError:
+                            # Removed between the stat and the read
+                            last_seen = None
+                            print(_STREAM_HEADER)
                             print("stream_worker        STOPPED    0s              0          0")
                             print("\nStream Status: Not running")
+                        except Exception as e:
+                            logger.error("Error reading status: %s", e)
+                            print(_STREAM_HEADER)
+                            print("stream_worker        ERROR      0s              0          0")
                     
-                    except Exception as e:
-                        logger.error(f"Error reading status: {e}")
-                        print("Worker Name          Status     Uptime          Processed  Errors")
-                        print("-" * 80)
-                        print("stream_worker        ERROR      0s              0          0")
-                    
-                    time.sleep(5)  # Update every 5 seconds
+                    time.sleep(1)  # Check for updates every second
                     
             except KeyboardInterrupt:
                 logger.info("Stream monitoring stopped")
@@ -343,12 +429,13 @@ class WorkerCLI:
         if self.start_worker("market_data_worker"):
             logger.info("Market data worker started. Press Ctrl+C to stop...")
             
+            self.running = True
             try:
                 # Keep running until interrupted
-                while self.running:
-                    time.sleep(1)
+                self._stop_event.wait()
             except KeyboardInterrupt:
                 logger.info("Demo interrupted by user")
+            self.running = False
             
             # Stop the worker
             self.stop_worker("market_data_worker")
@@ -361,13 +448,9 @@ class WorkerCLI:
             print("No workers registered")
             return
             
-        # Print headers
-        print("\n{:<20} {:<10} {:<15} {:<10} {:<15}".format(
-            "Worker Name", "Status", "Uptime", "Processed", "Errors"
-        ))
-        print("-" * 70)
+        # Headers, one row per worker and a trailing blank line, written at once
+        lines = [_STATUS_HEADER]
         
-        # Print each worker status
         for name, status in statuses.items():
             running = status.get("running", False)
             running_status = "RUNNING" if running else "STOPPED"
@@ -378,11 +461,13 @@ class WorkerCLI:
             processed = status.get("processed_count", 0)
             errors = status.get("error_count", 0)
             
-            print("{:<20} {:<10} {:<15} {:<10} {:<15}".format(
+            lines.append(_STATUS_ROW(
                 name, running_status, uptime_str, processed, errors
             ))
         
-        print()
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 
 def main():
@@ -432,56 +517,65 @@ def main():
     
     # Handle signals
     def signal_handler(sig, frame):
+        # A second Ctrl+C must not re-enter the handler mid-shutdown
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
         logger.info("Stopping workers due to signal")
         cli.stop_all_workers()
         cli.running = False
+        cli._stop_event.set()
+        cli.stop_logging()
         sys.exit(0)
     
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
     
-    # Register default workers for testing (skip for stream commands)
-    if args.command != "stream":
-        cli.register_default_workers()
-    
-    # Execute command
-    if args.command == "list":
-        workers = cli.list_workers()
-        print(f"\nRegistered workers ({len(workers)}):")
-        for worker in workers:
-            print(f"  - {worker}")
-        print()
-    
-    elif args.command == "start":
-        cli.start_worker(args.name)
-    
-    elif args.command == "stop":
-        cli.stop_worker(args.name)
-    
-    elif args.command == "start-all":
-        cli.start_all_workers()
-    
-    elif args.command == "stop-all":
-        cli.stop_all_workers()
-    
-    elif args.command == "status":
-        statuses = cli.get_worker_status(args.name)
-        cli.print_status_table(statuses)
-    
-    elif args.command == "monitor":
-        try:
-            cli.monitor_workers()
-        except KeyboardInterrupt:
-            logger.info("Monitoring stopped by user")
-    
-    elif args.command == "demo":
-        cli.run_demo()
-    
-    elif args.command == "stream":
-        cli.handle_stream_command(args.action)
-    
-    else:
-        parser.print_help()
+    try:
+        # Register default workers for testing (skip for stream commands)
+        if args.command != "stream":
+            cli.register_default_workers()
+        
+        # Execute command
+        if args.command == "list":
+            workers = cli.list_workers()
+            print(f"\nRegistered workers ({len(workers)}):")
+            for worker in workers:
+                print(f"  - {worker}")
+            print()
+        
+        elif args.command == "start":
+            cli.start_worker(args.name)
+        
+        elif args.command == "stop":
+            cli.stop_worker(args.name)
+        
+        elif args.command == "start-all":
+            cli.start_all_workers()
+        
+        elif args.command == "stop-all":
+            cli.stop_all_workers()
+        
+        elif args.command == "status":
+            statuses = cli.get_worker_status(args.name)
+            cli.print_status_table(statuses)
+        
+        elif args.command == "monitor":
+            try:
+                cli.monitor_workers()
+            except KeyboardInterrupt:
+                logger.info("Monitoring stopped by user")
+        
+        elif args.command == "demo":
+            cli.run_demo()
+        
+        elif args.command == "stream":
+            cli.handle_stream_command(args.action)
+        
+        else:
+            parser.print_help()
+    finally:
+        # Also on errors, so the records leading up to them are not lost
+        cli.stop_logging()
 
 
 if __name__ == "__main__":